@@ -1,13 +1,30 @@
 """Analysis modules for different aspects of English text."""
 
-from .vocabulary import VocabularyAnalyzer
-from .grammar import GrammarAnalyzer
-from .structure import StructureAnalyzer
-from .content import ContentAnalyzer
+from importlib import import_module
+from typing import Any
+
+# Analyzer classes are imported on first access, so importing one analyzer
+# module does not import the others (and their dependencies)
+_ANALYZER_MODULES = {
+    'VocabularyAnalyzer': '.vocabulary',
+    'GrammarAnalyzer': '.grammar',
+    'StructureAnalyzer': '.structure',
+    'ContentAnalyzer': '.content'
+}
 
 __all__ = [
     'VocabularyAnalyzer',
     'GrammarAnalyzer',
     'StructureAnalyzer',
     'ContentAnalyzer'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an analyzer class from its module on first access."""
+    module_name = _ANALYZER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
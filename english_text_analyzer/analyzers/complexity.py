@@ -1,11 +1,383 @@
 """Complexity analyzer for English text analysis."""
 
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Dict, Any, ClassVar, Optional, Tuple
 import langextract as lx
 import math
 import re
+import threading
+import numpy as np
+
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; clause scanning falls back to re
+    hyperscan = None
 
 from ..core.base_analyzer import BaseAnalyzer, AnalysisResult
+from ..core.result_cache import MemoryResultCache
+from ..models.records import SlottedRecord
+
+
+# Tokenization patterns shared by every metric; compiled once at import.
+_WORD_RE = re.compile(r'[A-Za-z]+')
+_SENT_RE = re.compile(r'[.!?]+')
+_CLAUSE_PATTERN = r'\b(?:and|but|or|because|since|although|while|when|if|that|which|who|where)\b'
+_CLAUSE_RE = re.compile(_CLAUSE_PATTERN, re.IGNORECASE)
+
+
+def _compile_clause_database() -> Optional["hyperscan.Database"]:
+    """Compile the clause-indicator pattern into a Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[_CLAUSE_PATTERN.encode('ascii')],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_CASELESS]
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_CLAUSE_DATABASE = _compile_clause_database()
+
+# Hyperscan scratch space must not be shared between threads
+_hyperscan_local = threading.local()
+
+# Byte lookup tables for the vectorized syllable scan (both cases map identically)
+_LETTER_LUT = np.zeros(256, dtype=bool)
+_LETTER_LUT[[ord(c) for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ']] = True
+_VOWEL_LUT = np.zeros(256, dtype=bool)
+_VOWEL_LUT[[ord(c) for c in 'aeiouyAEIOUY']] = True
+_VOWEL_BYTES = bytes(_VOWEL_LUT.astype(np.uint8))
+
+# Function words (articles, prepositions, conjunctions, etc.)
+FUNCTION_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'among', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+
+
+# Adaptation recommendation rules, in priority order, as
+# (predicate(fk_grade, syntactic_score, cefr_level), recommendations)
+_RECOMMENDATION_RULES = (
+    # Recommendations based on readability
+    (lambda fk, syn, cefr: fk > 12, (
+        "문장을 더 짧게 나누어 가독성 향상",
+        "복잡한 어휘를 더 간단한 동의어로 대체",
+        "수동태를 능동태로 변환하여 명확성 증대"
+    )),
+    (lambda fk, syn, cefr: fk < 6, (
+        "어휘 다양성을 높여 학습 효과 증대",
+        "더 복잡한 문장 구조 도입으로 도전 과제 제공",
+        "학술적 어휘 점진적 도입"
+    )),
+    # Recommendations based on syntactic complexity
+    (lambda fk, syn, cefr: syn > 7, (
+        "복잡한 절 구조를 단순화하여 이해도 향상",
+        "긴 문장을 여러 개의 짧은 문장으로 분할",
+        "접속사 사용을 줄여 문장 구조 단순화"
+    )),
+    (lambda fk, syn, cefr: syn < 3, (
+        "종속절을 활용한 문장 구조 복잡화",
+        "다양한 접속사와 전환어 도입",
+        "관계대명사절 활용으로 정보 밀도 증가"
+    )),
+    # CEFR-specific recommendations
+    (lambda fk, syn, cefr: cefr in ("A1", "A2"), (
+        "기본 시제와 문법 구조에 집중",
+        "일상적 주제와 친숙한 어휘 활용",
+        "반복 학습을 위한 패턴 강화"
+    )),
+    (lambda fk, syn, cefr: cefr in ("C1", "C2"), (
+        "추상적 개념과 복잡한 논증 구조 도입",
+        "전문 분야 어휘와 학술적 표현 활용",
+        "비판적 사고를 요구하는 내용 구성"
+    )),
+)
+
+
+
+def _select_recommendations(fk_grade: float, syntactic_score: float, cefr_level: str) -> List[str]:
+    """Select up to 8 adaptation recommendations from the rule table."""
+    matching = (
+        recommendations
+        for applies, recommendations in _RECOMMENDATION_RULES
+        if applies(fk_grade, syntactic_score, cefr_level)
+    )
+    
+    # Limit to 8 most relevant recommendations
+    return list(islice(chain.from_iterable(matching), 8))
+
+
+@dataclass
+class ReadabilityScores(SlottedRecord):
+    """Flesch readability scores."""
+    __slots__ = ("flesch_kincaid_grade", "flesch_reading_ease")
+    flesch_kincaid_grade: float
+    flesch_reading_ease: float
+
+
+@dataclass
+class LexicalDiversity(SlottedRecord):
+    """Lexical diversity and word-length metrics."""
+    __slots__ = ("ttr", "avg_word_length", "long_word_ratio")
+    ttr: float
+    avg_word_length: float
+    long_word_ratio: float
+
+
+@dataclass
+class SentenceMetrics(SlottedRecord):
+    """Sentence and word counts."""
+    __slots__ = ("avg_sentence_length", "total_sentences", "total_words")
+    avg_sentence_length: float
+    total_sentences: int
+    total_words: int
+
+
+@dataclass
+class SyntacticComplexity(SlottedRecord):
+    """Clause-based syntactic complexity metrics."""
+    __slots__ = ("avg_clauses_per_sentence", "complex_sentence_ratio", "syntactic_complexity_score")
+    avg_clauses_per_sentence: float
+    complex_sentence_ratio: float
+    syntactic_complexity_score: float
+
+
+@dataclass
+class InformationDensity(SlottedRecord):
+    """Content-word density metrics."""
+    __slots__ = ("content_word_ratio", "information_density")
+    content_word_ratio: float
+    information_density: float
+
+
+@dataclass
+class ComplexityMetrics(SlottedRecord):
+    """All complexity metrics for one text, before output rounding."""
+    __slots__ = (
+        "readability_scores", "cefr_level", "lexical_diversity", "sentence_metrics",
+        "syntactic_complexity", "information_density", "recommendations"
+    )
+    readability_scores: ReadabilityScores
+    cefr_level: str
+    lexical_diversity: LexicalDiversity
+    sentence_metrics: SentenceMetrics
+    syntactic_complexity: SyntacticComplexity
+    information_density: InformationDensity
+    recommendations: List[str]
+
+
+# Decimal places for each metric when complexity data is emitted; internal
+# metric functions return unrounded values and rounding happens once at the
+# edge (the public metric methods and format_complexity_report)
+_METRIC_PRECISION = {
+    "flesch_kincaid_grade": 1,
+    "flesch_reading_ease": 1,
+    "ttr": 3,
+    "avg_word_length": 1,
+    "long_word_ratio": 3,
+    "avg_sentence_length": 1,
+    "avg_clauses_per_sentence": 2,
+    "complex_sentence_ratio": 3,
+    "syntactic_complexity_score": 2,
+    "content_word_ratio": 3,
+    "information_density": 2,
+}
+
+
+def _round_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Round each known metric in a flat metrics dict to its output precision."""
+    return {
+        name: round(value, _METRIC_PRECISION[name]) if name in _METRIC_PRECISION else value
+        for name, value in metrics.items()
+    }
+
+
+def format_complexity_report(complexity_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Round the metrics in complexity data for output.
+    
+    Args:
+        complexity_data: Complexity data with unrounded metric values
+        
+    Returns:
+        Copy of the data with each metric rounded to its output precision
+    """
+    formatted = {}
+    for key, value in complexity_data.items():
+        if isinstance(value, dict):
+            value = _round_metrics(value)
+        formatted[key] = value
+    return formatted
+
+
+# Upper Flesch-Kincaid grade bound of each CEFR band; anything above is C2
+_CEFR_BANDS = ((3, "A1"), (6, "A2"), (9, "B1"), (12, "B2"), (16, "C1"))
+
+# Fast CEFR estimate: syllables per word approximated from average word
+# length, trusted only when it is this many grades away from a band boundary
+_SYLLABLES_PER_LETTER = 0.34
+_CEFR_FAST_MARGIN = 1.5
+
+
+def _cefr_band(fk_grade: float) -> str:
+    """Map a Flesch-Kincaid grade to a CEFR level."""
+    for upper_grade, level in _CEFR_BANDS:
+        if fk_grade <= upper_grade:
+            return level
+    return "C2"
+
+
+def _clause_hit_positions(text: str) -> np.ndarray:
+    """Return the start offsets of clause indicators in the text.
+    
+    Uses Hyperscan's DFA scan when it is installed and the text is ASCII
+    (so byte and character offsets agree and word boundaries match re);
+    otherwise scans with the stdlib re pattern.
+    """
+    if _CLAUSE_DATABASE is not None and text.isascii():
+        scratch = getattr(_hyperscan_local, 'scratch', None)
+        if scratch is None:
+            scratch = _hyperscan_local.scratch = hyperscan.Scratch(_CLAUSE_DATABASE)
+        hits = []
+        _CLAUSE_DATABASE.scan(
+            text.encode('ascii'),
+            match_event_handler=lambda _id, start, _end, _flags, _context: hits.append(start),
+            scratch=scratch
+        )
+        return np.array(hits, dtype=np.int64)
+    
+    return np.fromiter((match.start() for match in _CLAUSE_RE.finditer(text)), dtype=np.int64)
+
+
+def _scan_sentences(
+    text: str
+) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[str, ...], int]:
+    """Split sentences and count sentence endings in one finditer pass.
+    
+    Returns:
+        Tuple of (non-empty sentence spans, stripped sentences, ending count)
+    """
+    spans = []
+    sentences = []
+    endings = 0
+    prev_end = 0
+    for match in _SENT_RE.finditer(text):
+        endings += 1
+        sentence = text[prev_end:match.start()].strip()
+        if sentence:
+            spans.append((prev_end, match.start()))
+            sentences.append(sentence)
+        prev_end = match.end()
+    tail = text[prev_end:].strip()
+    if tail:
+        spans.append((prev_end, len(text)))
+        sentences.append(tail)
+    return tuple(spans), tuple(sentences), endings
+
+
+def _tokenize_text(text: str, sentence_endings: Optional[int] = None) -> Tuple[Tuple[str, ...], int]:
+    """Tokenize text into lowercased words and a sentence count.
+    
+    Args:
+        text: The text to tokenize
+        sentence_endings: Sentence-ending count from _scan_sentences(), if
+            the text was already scanned
+        
+    Returns:
+        Tuple of (lowercased words, sentence count)
+    """
+    if sentence_endings is None:
+        sentence_endings = _scan_sentences(text)[2]
+    # Fold case per token rather than copying the whole text with lower()
+    words = tuple(map(str.lower, _WORD_RE.findall(text)))
+    return words, sentence_endings or 1
+
+
+def _count_text_syllables(text: str) -> int:
+    """Count syllables across the whole text in one vectorized pass.
+    
+    Applies the same vowel-run heuristic as _syllables_in_word to every
+    [A-Za-z]+ run, using byte lookup tables instead of a per-char loop.
+    """
+    # Non-ASCII characters become '?' so they still split words
+    buf = np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8)
+    letters = _LETTER_LUT[buf]
+    if not letters.any():
+        return 0
+    
+    # Word boundaries from the edges of the letter mask
+    edges = np.diff(np.concatenate(([0], letters.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    
+    # A syllable starts wherever a vowel follows a non-vowel
+    vowels = _VOWEL_LUT[buf]
+    run_starts = vowels.copy()
+    run_starts[1:] &= ~vowels[:-1]
+    counts = np.add.reduceat(run_starts.astype(np.int32), starts)
+    
+    # Handle silent 'e'
+    counts -= ((buf[ends - 1] | 0x20) == ord('e')) & (counts > 1)
+    
+    return int(np.maximum(counts, 1).sum())
+
+
+@lru_cache(maxsize=50000)
+def _syllables_in_word(word: str) -> int:
+    """Count syllables in a single word using vowel patterns (memoized by word).
+    
+    Branchless SWAR form of the vowel-run heuristic: vowel flags are packed
+    one per byte lane into an int, and vowel-run starts are the lanes whose
+    lower neighbour is not a vowel.
+    """
+    data = word.encode('ascii', 'replace')
+    vowel_mask = int.from_bytes(data.translate(_VOWEL_BYTES), 'little')
+    run_starts = vowel_mask & ~(vowel_mask << 8)
+    syllable_count = bin(run_starts).count('1')
+    
+    # Handle silent 'e'
+    syllable_count -= (data[-1:] in (b'e', b'E')) & (syllable_count > 1)
+    
+    return max(1, syllable_count)
+
+
+def _approximate_grade(words: Tuple[str, ...], sentences: int) -> float:
+    """Flesch-Kincaid grade with syllables per word estimated from word length."""
+    avg_word_length = sum(map(len, words)) / len(words)
+    return max(
+        0.0,
+        0.39 * (len(words) / sentences) + 11.8 * (avg_word_length * _SYLLABLES_PER_LETTER) - 15.59
+    )
+
+
+def _estimate_cefr_level_fast(text: str) -> str:
+    """Estimate the CEFR level from word lengths, falling back near band boundaries.
+    
+    Agrees with the exact estimate unless the approximate grade is more
+    than _CEFR_FAST_MARGIN away from the exact one.
+    """
+    words, sentences = _tokenize_text(text)
+    if not words:
+        return _cefr_band(0.0)
+    
+    approx_grade = _approximate_grade(words, sentences)
+    if all(abs(approx_grade - upper_grade) > _CEFR_FAST_MARGIN for upper_grade, _ in _CEFR_BANDS):
+        return _cefr_band(approx_grade)
+    
+    # Too close to a boundary: use the exact syllable count
+    syllables = _count_text_syllables(text)
+    fk_grade = 0.39 * (len(words) / sentences) + 11.8 * (syllables / len(words)) - 15.59
+    return _cefr_band(max(0.0, fk_grade))
 
 
 class ComplexityAnalyzer(BaseAnalyzer):
@@ -15,11 +387,51 @@ class ComplexityAnalyzer(BaseAnalyzer):
     measures lexical diversity, and provides text adaptation recommendations.
     """
     
-    def __init__(self):
+    # Examples and prompt are shared by every instance in the process
+    _shared_examples: ClassVar[Optional[List[lx.data.ExampleData]]] = None
+    _shared_prompt_description: ClassVar[Optional[str]] = None
+    
+    # Process-wide instances keyed by (class, cache size), see get_shared()
+    _instances: ClassVar[Dict[Tuple[type, int], "ComplexityAnalyzer"]] = {}
+    
+    def __init__(self, cache_size: int = 128):
         super().__init__("complexity")
+        # Memoize full analyses per instance; identical passages are common
+        self._memory_cache = MemoryResultCache(cache_size)
+    
+    @classmethod
+    def get_shared(cls, cache_size: int = 128) -> "ComplexityAnalyzer":
+        """Return a process-wide analyzer instance for the given cache size.
+        
+        Reusing one instance keeps its analysis cache warm across callers
+        instead of starting from an empty cache for every new analyzer.
+        
+        Args:
+            cache_size: Maximum number of memoized analyses
+            
+        Returns:
+            Shared ComplexityAnalyzer instance
+        """
+        # Subclasses share the dict, so the class is part of the key
+        key = (cls, cache_size)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances.setdefault(key, cls(cache_size))
+        return instance
     
     def get_examples(self) -> List[lx.data.ExampleData]:
-        """Return example data for complexity analysis."""
+        """Return example data for complexity analysis.
+        
+        The examples are built once per process and shared by all instances.
+        """
+        if self._examples is None:
+            if ComplexityAnalyzer._shared_examples is None:
+                ComplexityAnalyzer._shared_examples = self._build_examples()
+            self._examples = ComplexityAnalyzer._shared_examples
+        return self._examples
+    
+    def _build_examples(self) -> List[lx.data.ExampleData]:
+        """Build the langextract example data for complexity analysis."""
         return [
             lx.data.ExampleData(
                 text="The cat sat on the mat. It was warm and sunny.",
@@ -79,6 +491,14 @@ class ComplexityAnalyzer(BaseAnalyzer):
     
     def get_prompt_description(self) -> str:
         """Return the prompt description for complexity analysis."""
+        if self._prompt_description is None:
+            if ComplexityAnalyzer._shared_prompt_description is None:
+                ComplexityAnalyzer._shared_prompt_description = self._build_prompt_description()
+            self._prompt_description = ComplexityAnalyzer._shared_prompt_description
+        return self._prompt_description
+    
+    def _build_prompt_description(self) -> str:
+        """Build the prompt description for complexity analysis."""
         return """
         Analyze the complexity and readability of the given English text. Focus on:
         
@@ -102,12 +522,27 @@ class ComplexityAnalyzer(BaseAnalyzer):
     def analyze(self, text: str) -> AnalysisResult:
         """Perform complexity analysis on the given text.
         
+        Results are memoized by text, so re-analyzing an identical passage
+        returns a copy of the cached AnalysisResult. Callers may modify the
+        returned result freely.
+        
         Args:
             text: The text to analyze
             
         Returns:
             AnalysisResult containing complexity analysis
         """
+        result = self._memory_cache.get(text)
+        if result is None:
+            result = self._memory_cache.put(text, self._analyze_uncached(text))
+        return result
+    
+    def clear_cache(self) -> None:
+        """Clear memoized analysis results."""
+        self._memory_cache.clear()
+    
+    def _analyze_uncached(self, text: str) -> AnalysisResult:
+        """Run complexity analysis without consulting the result cache."""
         try:
             # Use langextract for analysis
             examples = self.get_examples()
@@ -126,14 +561,33 @@ class ComplexityAnalyzer(BaseAnalyzer):
             # Fallback to direct analysis if langextract fails
             return self._fallback_analysis(text)
     
-    def calculate_readability_scores(self, text: str) -> Dict[str, float]:
-        """Calculate various readability scores for the text."""
-        sentences = self._count_sentences(text)
-        words = self._count_words(text)
-        syllables = self._count_syllables(text)
+    def _tokenize(self, text: str) -> Tuple[Tuple[str, ...], int]:
+        """Tokenize the text once for all metric calculations.
+        
+        Args:
+            text: The text to tokenize
+            
+        Returns:
+            Tuple of (lowercased words, sentence count)
+        """
+        return _tokenize_text(text)
+    
+    def calculate_readability_scores(
+        self, text: str, tokens: Optional[Tuple[Tuple[str, ...], int]] = None
+    ) -> Dict[str, float]:
+        """Calculate various readability scores for the text, rounded for output."""
+        return _round_metrics(self._readability_scores(text, tokens).to_dict())
+    
+    def _readability_scores(
+        self, text: str, tokens: Optional[Tuple[Tuple[str, ...], int]] = None
+    ) -> ReadabilityScores:
+        """Calculate readability scores as a ReadabilityScores record."""
+        word_list, sentences = tokens if tokens is not None else self._tokenize(text)
+        words = len(word_list)
+        syllables = _count_text_syllables(text)
         
         if sentences == 0 or words == 0:
-            return {"flesch_kincaid_grade": 0.0, "flesch_reading_ease": 0.0}
+            return ReadabilityScores(0.0, 0.0)
         
         # Flesch-Kincaid Grade Level
         fk_grade = 0.39 * (words / sentences) + 11.8 * (syllables / words) - 15.59
@@ -141,298 +595,256 @@ class ComplexityAnalyzer(BaseAnalyzer):
         # Flesch Reading Ease
         fre = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
         
-        return {
-            "flesch_kincaid_grade": round(max(0, fk_grade), 1),
-            "flesch_reading_ease": round(max(0, min(100, fre)), 1)
-        }
+        return ReadabilityScores(
+            flesch_kincaid_grade=max(0.0, fk_grade),
+            flesch_reading_ease=max(0.0, min(100.0, fre))
+        )
     
-    def estimate_cefr_level(self, text: str) -> str:
+    def estimate_cefr_level(
+        self, text: str, tokens: Optional[Tuple[Tuple[str, ...], int]] = None
+    ) -> str:
         """Estimate CEFR level based on text complexity."""
-        scores = self.calculate_readability_scores(text)
-        fk_grade = scores["flesch_kincaid_grade"]
-        
-        # CEFR level estimation based on Flesch-Kincaid grade
-        if fk_grade <= 3:
-            return "A1"
-        elif fk_grade <= 6:
-            return "A2"
-        elif fk_grade <= 9:
-            return "B1"
-        elif fk_grade <= 12:
-            return "B2"
-        elif fk_grade <= 16:
-            return "C1"
-        else:
-            return "C2"
-    
-    def analyze_lexical_diversity(self, text: str) -> Dict[str, float]:
-        """Analyze lexical diversity and vocabulary complexity."""
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        return _cefr_band(self._readability_scores(text, tokens).flesch_kincaid_grade)
+    
+    def estimate_cefr_level_fast(self, text: str) -> str:
+        """Estimate CEFR level without the syllable scan when the band is clear.
         
-        if not words:
-            return {"ttr": 0.0, "avg_word_length": 0.0, "long_word_ratio": 0.0}
+        Approximates syllables per word from average word length. Only when
+        the approximate grade lies near a CEFR band boundary is the full
+        readability computation run. The result therefore agrees with
+        estimate_cefr_level() except when the approximation is off by more
+        than the boundary margin (1.5 grades), which happens for texts
+        whose syllable density is far from typical English.
         
-        unique_words = set(words)
+        Args:
+            text: The text to analyze
+            
+        Returns:
+            Estimated CEFR level (A1-C2)
+        """
+        return _estimate_cefr_level_fast(text)
+    
+    def analyze_lexical_diversity(
+        self, text: str, words: Optional[Tuple[str, ...]] = None
+    ) -> Dict[str, float]:
+        """Analyze lexical diversity and vocabulary complexity, rounded for output."""
+        if words is None:
+            words, _ = self._tokenize(text)
+        return _round_metrics(self._lexical_diversity(words).to_dict())
+    
+    def _lexical_diversity(self, words: Tuple[str, ...]) -> LexicalDiversity:
+        """Calculate lexical diversity as a LexicalDiversity record."""
+        if not words:
+            return LexicalDiversity(0.0, 0.0, 0.0)
         
         # Type-Token Ratio
-        ttr = len(unique_words) / len(words)
+        ttr = len(set(words)) / len(words)
+        
+        # Word-length statistics as vector operations over a length array
+        lengths = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
         
         # Average word length
-        avg_word_length = sum(len(word) for word in words) / len(words)
+        avg_word_length = float(lengths.mean())
         
         # Long word ratio (words with 6+ characters)
-        long_words = [word for word in words if len(word) >= 6]
-        long_word_ratio = len(long_words) / len(words)
-        
-        return {
-            "ttr": round(ttr, 3),
-            "avg_word_length": round(avg_word_length, 1),
-            "long_word_ratio": round(long_word_ratio, 3)
-        }
-    
-    def analyze_syntactic_complexity(self, text: str) -> Dict[str, float]:
-        """Analyze syntactic complexity of the text."""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
-            return {"avg_clauses_per_sentence": 0.0, "complex_sentence_ratio": 0.0, "syntactic_complexity_score": 0.0}
-        
-        total_clauses = 0
-        complex_sentences = 0
-        
-        for sentence in sentences:
-            # Count clauses by looking for conjunctions and relative pronouns
-            clause_indicators = re.findall(r'\b(and|but|or|because|since|although|while|when|if|that|which|who|where)\b', sentence.lower())
-            clauses = len(clause_indicators) + 1  # Base sentence + subordinate clauses
-            total_clauses += clauses
-            
-            # Complex sentence if it has subordinate clauses
-            if clauses > 1:
-                complex_sentences += 1
+        long_word_ratio = float(np.count_nonzero(lengths >= 6)) / len(words)
         
-        avg_clauses = total_clauses / len(sentences)
-        complex_ratio = complex_sentences / len(sentences)
+        return LexicalDiversity(
+            ttr=ttr,
+            avg_word_length=avg_word_length,
+            long_word_ratio=long_word_ratio
+        )
+    
+    def analyze_syntactic_complexity(
+        self, text: str, spans: Optional[Tuple[Tuple[int, int], ...]] = None
+    ) -> Dict[str, float]:
+        """Analyze syntactic complexity of the text, rounded for output."""
+        if spans is None:
+            spans = self._sentence_spans(text)
+        return _round_metrics(self._syntactic_complexity(text, spans).to_dict())
+    
+    def _syntactic_complexity(
+        self, text: str, spans: Tuple[Tuple[int, int], ...]
+    ) -> SyntacticComplexity:
+        """Calculate syntactic complexity as a SyntacticComplexity record."""
+        if not spans:
+            return SyntacticComplexity(0.0, 0.0, 0.0)
+        
+        # Count clauses by looking for conjunctions and relative pronouns,
+        # scanning the whole text once and segment-summing hits per sentence
+        span_starts = np.fromiter((start for start, _ in spans), dtype=np.int64, count=len(spans))
+        hit_positions = _clause_hit_positions(text)
+        sentence_index = np.searchsorted(span_starts, hit_positions, side='right') - 1
+        
+        # Base sentence + subordinate clauses
+        clauses_per_sentence = np.bincount(sentence_index, minlength=len(spans)) + 1
+        total_clauses = int(clauses_per_sentence.sum())
+        
+        # Complex sentence if it has subordinate clauses
+        complex_sentences = int(np.count_nonzero(clauses_per_sentence > 1))
+        
+        avg_clauses = total_clauses / len(spans)
+        complex_ratio = complex_sentences / len(spans)
         
         # Syntactic complexity score (0-10 scale)
         complexity_score = min(10, avg_clauses * 2 + complex_ratio * 3)
         
-        return {
-            "avg_clauses_per_sentence": round(avg_clauses, 2),
-            "complex_sentence_ratio": round(complex_ratio, 3),
-            "syntactic_complexity_score": round(complexity_score, 2)
-        }
+        return SyntacticComplexity(
+            avg_clauses_per_sentence=avg_clauses,
+            complex_sentence_ratio=complex_ratio,
+            syntactic_complexity_score=complexity_score
+        )
+    
+    def _sentence_spans(self, text: str) -> Tuple[Tuple[int, int], ...]:
+        """Return (start, end) offsets of the non-empty sentences in the text."""
+        return _scan_sentences(text)[0]
+    
+    def _split_sentences(self, text: str) -> List[str]:
+        """Split the text into stripped, non-empty sentences."""
+        return list(_scan_sentences(text)[1])
     
-    def calculate_information_density(self, text: str) -> Dict[str, float]:
-        """Calculate information density metrics."""
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        sentences = self._count_sentences(text)
+    def calculate_information_density(
+        self, text: str, tokens: Optional[Tuple[Tuple[str, ...], int]] = None
+    ) -> Dict[str, float]:
+        """Calculate information density metrics, rounded for output."""
+        if tokens is None:
+            tokens = self._tokenize(text)
+        return _round_metrics(self._information_density(tokens).to_dict())
+    
+    def _information_density(self, tokens: Tuple[Tuple[str, ...], int]) -> InformationDensity:
+        """Calculate information density as an InformationDensity record."""
+        words, sentences = tokens
         
         if not words or sentences == 0:
-            return {"content_word_ratio": 0.0, "information_density": 0.0}
-        
-        # Function words (articles, prepositions, conjunctions, etc.)
-        function_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'between', 'among', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those',
-            'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
-        }
+            return InformationDensity(0.0, 0.0)
         
-        content_words = [word for word in words if word not in function_words]
-        content_word_ratio = len(content_words) / len(words)
+        content_words = sum(1 for word in words if word not in FUNCTION_WORDS)
+        content_word_ratio = content_words / len(words)
         
         # Information density: content words per sentence
-        info_density = len(content_words) / sentences
+        info_density = content_words / sentences
         
-        return {
-            "content_word_ratio": round(content_word_ratio, 3),
-            "information_density": round(info_density, 2)
-        }
+        return InformationDensity(
+            content_word_ratio=content_word_ratio,
+            information_density=info_density
+        )
     
     def generate_adaptation_recommendations(self, complexity_data: Dict[str, Any]) -> List[str]:
         """Generate text adaptation recommendations based on complexity analysis."""
-        recommendations = []
-        
-        fk_grade = complexity_data.get("readability_scores", {}).get("flesch_kincaid_grade", 0)
-        cefr_level = complexity_data.get("cefr_level", "Unknown")
-        syntactic_score = complexity_data.get("syntactic_complexity", {}).get("syntactic_complexity_score", 0)
-        
-        # Recommendations based on readability
-        if fk_grade > 12:
-            recommendations.extend([
-                "문장을 더 짧게 나누어 가독성 향상",
-                "복잡한 어휘를 더 간단한 동의어로 대체",
-                "수동태를 능동태로 변환하여 명확성 증대"
-            ])
-        elif fk_grade < 6:
-            recommendations.extend([
-                "어휘 다양성을 높여 학습 효과 증대",
-                "더 복잡한 문장 구조 도입으로 도전 과제 제공",
-                "학술적 어휘 점진적 도입"
-            ])
-        
-        # Recommendations based on syntactic complexity
-        if syntactic_score > 7:
-            recommendations.extend([
-                "복잡한 절 구조를 단순화하여 이해도 향상",
-                "긴 문장을 여러 개의 짧은 문장으로 분할",
-                "접속사 사용을 줄여 문장 구조 단순화"
-            ])
-        elif syntactic_score < 3:
-            recommendations.extend([
-                "종속절을 활용한 문장 구조 복잡화",
-                "다양한 접속사와 전환어 도입",
-                "관계대명사절 활용으로 정보 밀도 증가"
-            ])
-        
-        # CEFR-specific recommendations
-        if cefr_level in ["A1", "A2"]:
-            recommendations.extend([
-                "기본 시제와 문법 구조에 집중",
-                "일상적 주제와 친숙한 어휘 활용",
-                "반복 학습을 위한 패턴 강화"
-            ])
-        elif cefr_level in ["C1", "C2"]:
-            recommendations.extend([
-                "추상적 개념과 복잡한 논증 구조 도입",
-                "전문 분야 어휘와 학술적 표현 활용",
-                "비판적 사고를 요구하는 내용 구성"
-            ])
-        
-        return recommendations[:8]  # Limit to 8 most relevant recommendations
-    
-    def _count_sentences(self, text: str) -> int:
-        """Count sentences in the text."""
-        sentence_endings = re.findall(r'[.!?]+', text)
-        return max(1, len(sentence_endings))
+        return _select_recommendations(
+            complexity_data.get("readability_scores", {}).get("flesch_kincaid_grade", 0),
+            complexity_data.get("syntactic_complexity", {}).get("syntactic_complexity_score", 0),
+            complexity_data.get("cefr_level", "Unknown")
+        )
+    
+    def _count_sentences(self, text: str, sentence_count: Optional[int] = None) -> int:
+        """Count sentences in the text.
+        
+        Args:
+            text: The text to count sentences in
+            sentence_count: Precomputed sentence-ending count, if already known
+            
+        Returns:
+            Number of sentences, at least 1
+        """
+        if sentence_count is None:
+            sentence_count = _scan_sentences(text)[2]
+        return sentence_count or 1
     
     def _count_words(self, text: str) -> int:
         """Count words in the text."""
-        words = re.findall(r'\b[a-zA-Z]+\b', text)
+        words = _WORD_RE.findall(text)
         return len(words)
     
     def _count_syllables(self, text: str) -> int:
         """Count syllables in the text using a simple heuristic."""
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        total_syllables = 0
-        
-        for word in words:
-            syllables = self._count_syllables_in_word(word)
-            total_syllables += syllables
-        
-        return total_syllables
+        return _count_text_syllables(text)
     
     def _count_syllables_in_word(self, word: str) -> int:
         """Count syllables in a single word using vowel patterns."""
-        word = word.lower()
-        vowels = "aeiouy"
-        syllable_count = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_was_vowel:
-                syllable_count += 1
-            prev_was_vowel = is_vowel
-        
-        # Handle silent 'e'
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
-        
-        return max(1, syllable_count)
+        return _syllables_in_word(word)
     
     def post_process_results(self, raw_results: lx.data.AnnotatedDocument) -> AnalysisResult:
         """Post-process the raw langextract results into structured complexity analysis."""
-        complexity_data = {
-            "readability_scores": {},
-            "cefr_level": "Unknown",
-            "lexical_diversity": {},
-            "sentence_metrics": {},
-            "syntactic_complexity": {},
-            "information_density": {},
-            "recommendations": []
-        }
-        
         text = raw_results.text
+        complexity_data = self._build_complexity_data(text)
         
-        # Calculate readability scores
-        complexity_data["readability_scores"] = self.calculate_readability_scores(text)
-        
-        # Estimate CEFR level
-        complexity_data["cefr_level"] = self.estimate_cefr_level(text)
-        
-        # Analyze lexical diversity
-        complexity_data["lexical_diversity"] = self.analyze_lexical_diversity(text)
-        
-        # Calculate sentence metrics
-        sentences = self._count_sentences(text)
-        words = self._count_words(text)
-        complexity_data["sentence_metrics"] = {
-            "avg_sentence_length": round(words / sentences, 1) if sentences > 0 else 0,
-            "total_sentences": sentences,
-            "total_words": words
-        }
-        
-        # Analyze syntactic complexity
-        complexity_data["syntactic_complexity"] = self.analyze_syntactic_complexity(text)
-        
-        # Calculate information density
-        complexity_data["information_density"] = self.calculate_information_density(text)
-        
-        # Generate adaptation recommendations
-        complexity_data["recommendations"] = self.generate_adaptation_recommendations(complexity_data)
-        
-        # Process extractions from langextract
-        for extraction in raw_results.extractions:
-            if extraction.extraction_class == "readability_assessment":
-                # Additional processing can be added here
-                pass
+        # Use the first readability assessment from langextract, if any
+        assessment = next(
+            (extraction for extraction in raw_results.extractions
+             if extraction.extraction_class == "readability_assessment"),
+            None
+        )
         
         result = AnalysisResult(
             analyzer_name="complexity",
             analysis_data={"complexity_analysis": [complexity_data]}
         )
+        if assessment is not None:
+            result.add_metadata("llm_assessment", dict(assessment.attributes or {}))
         result.results = complexity_data
         result.confidence_score = 0.85
         result.processing_time = 0.0
         return result
     
-    def _fallback_analysis(self, text: str) -> AnalysisResult:
-        """Fallback analysis when langextract is not available.
+    def _build_complexity_data(self, text: str) -> Dict[str, Any]:
+        """Calculate every complexity metric for the text.
         
         Args:
             text: The text to analyze
             
         Returns:
-            AnalysisResult with basic complexity analysis
+            Dictionary of complexity metrics and recommendations, rounded
+            for output by format_complexity_report()
         """
-        complexity_data = {
-            "readability_scores": self.calculate_readability_scores(text),
-            "cefr_level": self.estimate_cefr_level(text),
-            "lexical_diversity": self.analyze_lexical_diversity(text),
-            "sentence_metrics": {},
-            "syntactic_complexity": self.analyze_syntactic_complexity(text),
-            "information_density": self.calculate_information_density(text),
-            "recommendations": []
-        }
+        return format_complexity_report(self._compute_metrics(text).to_dict())
+    
+    def _compute_metrics(self, text: str) -> ComplexityMetrics:
+        """Calculate every complexity metric for the text as a ComplexityMetrics record."""
+        # Scan sentences and tokenize words once and share them across all metrics
+        spans, _, sentence_endings = _scan_sentences(text)
+        tokens = _tokenize_text(text, sentence_endings)
+        
+        readability = self._readability_scores(text, tokens)
+        lexical = self._lexical_diversity(tokens[0])
+        syntactic = self._syntactic_complexity(text, spans)
+        density = self._information_density(tokens)
         
         # Calculate sentence metrics
-        sentences = self._count_sentences(text)
-        words = self._count_words(text)
-        complexity_data["sentence_metrics"] = {
-            "avg_sentence_length": round(words / sentences, 1) if sentences > 0 else 0,
-            "total_sentences": sentences,
-            "total_words": words
-        }
+        words, sentences = len(tokens[0]), tokens[1]
+        sentence_metrics = SentenceMetrics(
+            avg_sentence_length=words / sentences if sentences > 0 else 0,
+            total_sentences=sentences,
+            total_words=words
+        )
+        
+        cefr_level = _cefr_band(readability.flesch_kincaid_grade)
         
-        # Generate recommendations
-        complexity_data["recommendations"] = self.generate_adaptation_recommendations(complexity_data)
+        # Generate adaptation recommendations from the unrounded metrics
+        recommendations = _select_recommendations(
+            readability.flesch_kincaid_grade, syntactic.syntactic_complexity_score, cefr_level
+        )
         
+        return ComplexityMetrics(
+            readability_scores=readability,
+            cefr_level=cefr_level,
+            lexical_diversity=lexical,
+            sentence_metrics=sentence_metrics,
+            syntactic_complexity=syntactic,
+            information_density=density,
+            recommendations=recommendations
+        )
+    
+    def _fallback_analysis(self, text: str) -> AnalysisResult:
+        """Fallback analysis when langextract is not available.
+        
+        Args:
+            text: The text to analyze
+            
+        Returns:
+            AnalysisResult with basic complexity analysis
+        """
         return AnalysisResult(
             analyzer_name="complexity",
-            analysis_data={"complexity_analysis": [complexity_data]}
+            analysis_data={"complexity_analysis": [self._build_complexity_data(text)]}
         )
-                      
\ No newline at end of file
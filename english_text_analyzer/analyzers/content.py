@@ -1,9 +1,143 @@
 """Content analyzer for English text analysis."""
 
-from typing import List, Dict, Any
-import langextract as lx
+from __future__ import annotations
 
-from ..core.base_analyzer import BaseAnalyzer, AnalysisResult
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice, repeat
+from operator import itemgetter, methodcaller
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Any, ClassVar, Iterable, Iterator, Optional, Tuple, Union
+import asyncio
+import multiprocessing
+import os
+import re
+import threading
+
+from ..core.base_analyzer import BaseAnalyzer, AnalysisResult, select_extraction_classes
+from ..core.result_cache import DiskResultCache
+from ..models.records import SlottedRecord
+
+if TYPE_CHECKING:
+    import langextract as lx
+
+
+# Extraction classes the content prompt can request, in prompt order
+EXTRACTION_CLASSES = (
+    "main_idea",
+    "supporting_detail",
+    "evidence",
+    "argument_structure",
+    "content_hierarchy"
+)
+
+# Prompt section (title, then detail lines) for each extraction class
+_PROMPT_SECTIONS = {
+    "main_idea": (
+        "**Main Ideas**: Identify central themes and key points",
+        "- Type: thesis_statement, problem_statement, research_overview, conclusion",
+        "- Position: opening, middle, closing",
+        "- Scope: general_claim, specific_point, global_issue, study_summary, implication",
+        "- Provide Korean educational notes",
+    ),
+    "supporting_detail": (
+        "**Supporting Details**: Identify information that supports main ideas",
+        "- Type: explanation, example, finding, additional_benefit, conclusion_statement",
+        "- Support_type: elaboration, research_result, synthesis, specification",
+        "- Sequence: first, second, third (if applicable)",
+        "- Relates_to: which main idea this detail supports",
+        "- Include Korean explanations",
+    ),
+    "evidence": (
+        "**Evidence**: Identify different types of supporting evidence",
+        "- Evidence_type: example, statistical_data, expert_opinion, research_findings, analogy, case_study",
+        "- Source: where the evidence comes from",
+        "- Strength: strong, moderate, weak",
+        "- Supports: what claim or idea the evidence supports",
+        "- Provide Korean analysis of evidence quality",
+    ),
+    "argument_structure": (
+        "**Argument Structure**: Identify components of argumentation",
+        "- Component: main_claim, opposing_claim, warrant, backing, qualifier, rebuttal",
+        "- Argument_type: assertion, counterargument_acknowledgment, refutation, balanced_perspective",
+        "- Position: author_viewpoint, opposing_viewpoint, qualifying_statement",
+        "- Include Korean explanations of argument logic",
+    ),
+    "content_hierarchy": (
+        "**Content Hierarchy**: Identify the organizational structure",
+        "- Level: primary, secondary, tertiary",
+        "- Relationship: supports, contradicts, elaborates, exemplifies",
+        "- Function: introduce, develop, conclude, transition",
+    ),
+}
+
+# Environment variable overriding the default analyze_batch() batch size
+_BATCH_SIZE_ENV = "ETA_CONTENT_BATCH_SIZE"
+_DEFAULT_BATCH_SIZE = 32
+
+# Bump when AnalysisResult contents change so stale disk cache entries are ignored
+_CACHE_VERSION = 2
+
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Quality score per evidence strength; unknown strengths score 1
+_STRENGTH_SCORES = {"strong": 3, "moderate": 2, "weak": 1}
+
+# Complexity score per argument type; unknown types score 1
+_ARGUMENT_COMPLEXITY_SCORES = {
+    "assertion": 1,
+    "counterargument_acknowledgment": 3,
+    "refutation": 4,
+    "balanced_perspective": 4
+}
+
+
+
+@dataclass(frozen=True)
+class IdeaEntry(SlottedRecord):
+    """Main idea entry in the content hierarchy."""
+    __slots__ = ("text", "type", "position")
+    text: str
+    type: str
+    position: str
+
+
+@dataclass(frozen=True)
+class DetailEntry(SlottedRecord):
+    """Supporting detail entry in the content hierarchy."""
+    __slots__ = ("text", "type", "relates_to")
+    text: str
+    type: str
+    relates_to: str
+
+
+@dataclass(frozen=True)
+class EvidenceEntry(SlottedRecord):
+    """Evidence entry in the content hierarchy."""
+    __slots__ = ("text", "type", "strength", "supports")
+    text: str
+    type: str
+    strength: str
+    supports: str
+
+
+@dataclass
+class ContentHierarchy(SlottedRecord):
+    """Hierarchical outline of ideas, details and evidence."""
+    __slots__ = ("primary_ideas", "secondary_details", "supporting_evidence")
+    primary_ideas: List[IdeaEntry]
+    secondary_details: List[DetailEntry]
+    supporting_evidence: List[EvidenceEntry]
+
+
+def _column(attributes: List[Dict[str, Any]], key: str, default: str) -> List[Any]:
+    """Read one attribute from every extraction's attributes, as a column."""
+    return list(map(methodcaller("get", key, default), attributes))
+
+
+def _split_text(text: str) -> Tuple[str, ...]:
+    """Split text into stripped, non-empty sentences."""
+    return tuple(s for s in (part.strip() for part in _SENT_RE.split(text)) if s)
 
 
 class ContentAnalyzer(BaseAnalyzer):
@@ -13,11 +147,68 @@ class ContentAnalyzer(BaseAnalyzer):
     argument structures, and hierarchical content organization.
     """
     
-    def __init__(self):
+    # Examples and prompt are static, so they are built once per process
+    _shared_examples: ClassVar[Optional[List[lx.data.ExampleData]]] = None
+    _shared_prompt_description: ClassVar[Optional[str]] = None
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        extraction_classes: Optional[Iterable[str]] = None
+    ):
+        """Initialize the content analyzer.
+        
+        Args:
+            cache_dir: Directory for the persistent result cache, e.g.
+                ~/.cache/english_text_analyzer/content. Results are not
+                cached on disk when None.
+            extraction_classes: Extraction classes to request from the
+                model (see EXTRACTION_CLASSES); all of them when None.
+                Leaving out unneeded classes shortens the prompt, the
+                examples and the model output.
+        """
         super().__init__("content")
+        self._extraction_classes = select_extraction_classes(
+            extraction_classes, EXTRACTION_CLASSES, "content"
+        )
+        self._lx_analyzer = None
+        self._lx_analyzer_lock = threading.Lock()
+        self._disk_cache = DiskResultCache(cache_dir, "content", _CACHE_VERSION)
     
     def get_examples(self) -> List[lx.data.ExampleData]:
-        """Return example data for content analysis."""
+        """Return example data for content analysis.
+        
+        The examples for the default extraction classes are built once per
+        process and shared by all instances.
+        """
+        if self._examples is None:
+            if self._extraction_classes != EXTRACTION_CLASSES:
+                self._examples = self._select_examples(self._build_examples())
+            else:
+                if ContentAnalyzer._shared_examples is None:
+                    ContentAnalyzer._shared_examples = self._build_examples()
+                self._examples = ContentAnalyzer._shared_examples
+        return self._examples
+    
+    def _select_examples(self, examples: List[lx.data.ExampleData]) -> List[lx.data.ExampleData]:
+        """Keep only extractions of the selected classes, dropping emptied examples."""
+        import langextract as lx
+        
+        selected = []
+        for example in examples:
+            extractions = [
+                extraction for extraction in example.extractions
+                if extraction.extraction_class in self._extraction_classes
+            ]
+            if extractions:
+                selected.append(lx.data.ExampleData(text=example.text, extractions=extractions))
+        return selected
+    
+    def _build_examples(self) -> List[lx.data.ExampleData]:
+        """Build the langextract example data for content analysis."""
+        # Imported here so that importing this module does not load langextract
+        import langextract as lx
+        
         return [
             lx.data.ExampleData(
                 text="Education is the foundation of personal and societal development. It provides individuals with knowledge and skills necessary for success. Furthermore, education promotes critical thinking and creativity. For example, students who receive quality education are more likely to become innovative leaders.",
@@ -220,62 +411,204 @@ class ContentAnalyzer(BaseAnalyzer):
     
     def get_prompt_description(self) -> str:
         """Return the prompt description for content analysis."""
-        return """
-        Analyze the content structure and argumentation in the given English text and extract the following information:
-
-        1. **Main Ideas**: Identify central themes and key points
-           - Type: thesis_statement, problem_statement, research_overview, conclusion
-           - Position: opening, middle, closing
-           - Scope: general_claim, specific_point, global_issue, study_summary, implication
-           - Provide Korean educational notes
-
-        2. **Supporting Details**: Identify information that supports main ideas
-           - Type: explanation, example, finding, additional_benefit, conclusion_statement
-           - Support_type: elaboration, research_result, synthesis, specification
-           - Sequence: first, second, third (if applicable)
-           - Relates_to: which main idea this detail supports
-           - Include Korean explanations
-
-        3. **Evidence**: Identify different types of supporting evidence
-           - Evidence_type: example, statistical_data, expert_opinion, research_findings, analogy, case_study
-           - Source: where the evidence comes from
-           - Strength: strong, moderate, weak
-           - Supports: what claim or idea the evidence supports
-           - Provide Korean analysis of evidence quality
-
-        4. **Argument Structure**: Identify components of argumentation
-           - Component: main_claim, opposing_claim, warrant, backing, qualifier, rebuttal
-           - Argument_type: assertion, counterargument_acknowledgment, refutation, balanced_perspective
-           - Position: author_viewpoint, opposing_viewpoint, qualifying_statement
-           - Include Korean explanations of argument logic
-
-        5. **Content Hierarchy**: Identify the organizational structure
-           - Level: primary, secondary, tertiary
-           - Relationship: supports, contradicts, elaborates, exemplifies
-           - Function: introduce, develop, conclude, transition
-
-        Focus on content elements that help Korean learners understand how English texts present and develop ideas.
-        Provide detailed Korean explanations to help understand argument structure and evidence evaluation.
-        """
+        if self._prompt_description is None:
+            if self._extraction_classes != EXTRACTION_CLASSES:
+                self._prompt_description = self._build_prompt_description()
+            else:
+                if ContentAnalyzer._shared_prompt_description is None:
+                    ContentAnalyzer._shared_prompt_description = self._build_prompt_description()
+                self._prompt_description = ContentAnalyzer._shared_prompt_description
+        return self._prompt_description
+    
+    def _build_prompt_description(self) -> str:
+        """Build the prompt description for the selected extraction classes."""
+        lines = [
+            "",
+            "        Analyze the content structure and argumentation in the given English text "
+            "and extract the following information:",
+        ]
+        selected = [_PROMPT_SECTIONS[name] for name in self._extraction_classes]
+        for number, (title, *details) in enumerate(selected, 1):
+            lines.append("")
+            lines.append(f"        {number}. {title}")
+            lines.extend(f"           {detail}" for detail in details)
+        lines.extend([
+            "",
+            "        Focus on content elements that help Korean learners understand how English texts "
+            "present and develop ideas.",
+            "        Provide detailed Korean explanations to help understand argument structure "
+            "and evidence evaluation.",
+            "        ",
+        ])
+        return "\n".join(lines)
     
     def analyze(self, text: str) -> AnalysisResult:
         """Perform content analysis on the given text."""
-        if not self.validate_text(text):
+        is_valid, sentences = self._validate_and_split(text)
+        if not is_valid:
             raise ValueError("Text is not suitable for content analysis")
         
-        # Use langextract to perform the analysis
-        examples = self.get_examples()
-        prompt_description = self.get_prompt_description()
-        
-        # Create langextract analyzer
-        analyzer = lx.Analyzer(
-            examples=examples,
-            description=prompt_description
-        )
+        result = self._load_cached(text)
+        if result is not None:
+            return result
         
         # Perform analysis
-        raw_results = analyzer.analyze(text)
+        raw_results = self._get_lx_analyzer().analyze(text)
+        
+        return self._store_cached(text, self._build_result(raw_results, len(sentences)))
+    
+    async def analyze_async(self, text: str) -> AnalysisResult:
+        """Perform content analysis without blocking the event loop.
+        
+        The langextract call runs in the loop's default executor, so other
+        coroutines (including post-processing of finished texts) run while
+        the model request is in flight.
+        """
+        is_valid, sentences = self._validate_and_split(text)
+        if not is_valid:
+            raise ValueError("Text is not suitable for content analysis")
+        
+        result = self._load_cached(text)
+        if result is not None:
+            return result
+        
+        # Perform analysis off the event loop
+        loop = asyncio.get_running_loop()
+        raw_results = await loop.run_in_executor(None, self._get_lx_analyzer().analyze, text)
+        
+        return self._store_cached(text, self._build_result(raw_results, len(sentences)))
+    
+    async def analyze_batch_async(self, texts: Iterable[str], concurrency: int = 8) -> List[AnalysisResult]:
+        """Perform content analysis on several texts with overlapping model calls.
+        
+        Args:
+            texts: The texts to analyze
+            concurrency: Maximum number of langextract calls in flight
+            
+        Returns:
+            List of AnalysisResult objects in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(text: str) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze_async(text)
+        
+        return list(await asyncio.gather(*(analyze_one(text) for text in texts)))
+    
+    def analyze_batch(self, texts: Iterable[str], batch_size: Optional[int] = None) -> Iterator[AnalysisResult]:
+        """Perform content analysis on several texts with one langextract analyzer.
+        
+        The langextract analyzer is set up once and reused for every text.
+        If it supports batched analysis, texts are submitted in chunks of
+        batch_size. Results are yielded as each chunk completes, so only one
+        chunk of texts and results is held in memory at a time.
         
+        Args:
+            texts: The texts to analyze; may be any (lazy) iterable
+            batch_size: Texts per langextract batch; defaults to the
+                ETA_CONTENT_BATCH_SIZE environment variable or 32
+            
+        Yields:
+            AnalysisResult objects in the same order as texts
+        """
+        if batch_size is None:
+            batch_size = int(os.environ.get(_BATCH_SIZE_ENV, _DEFAULT_BATCH_SIZE))
+        
+        text_iter = iter(texts)
+        while True:
+            chunk = list(islice(text_iter, batch_size))
+            if not chunk:
+                return
+            yield from self._analyze_chunk(chunk, batch_size)
+    
+    def _analyze_chunk(self, chunk: List[str], batch_size: int) -> List[AnalysisResult]:
+        """Analyze one analyze_batch() chunk, skipping texts found in the disk cache."""
+        sentence_counts = []
+        for text in chunk:
+            is_valid, sentences = self._validate_and_split(text)
+            if not is_valid:
+                raise ValueError("Text is not suitable for content analysis")
+            sentence_counts.append(len(sentences))
+        
+        # Only texts missing from the disk cache go to langextract
+        results = [self._load_cached(text) for text in chunk]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        analyzer = self._get_lx_analyzer()
+        analyze_many = getattr(analyzer, "analyze_batch", None)
+        pending_texts = [chunk[i] for i in pending]
+        if analyze_many is not None:
+            raw_chunk = analyze_many(pending_texts, batch_size=batch_size)
+        else:
+            raw_chunk = [analyzer.analyze(text) for text in pending_texts]
+        
+        for i, raw_results in zip(pending, raw_chunk):
+            results[i] = self._store_cached(chunk[i], self._build_result(raw_results, sentence_counts[i]))
+        
+        return results
+    
+    def analyze_parallel(
+        self, texts: Iterable[str], n_jobs: Optional[int] = None, chunksize: int = 16
+    ) -> Iterator[AnalysisResult]:
+        """Perform content analysis on several texts in a pool of worker processes.
+        
+        Each worker builds its own ContentAnalyzer once, when the pool starts,
+        and reuses it for every text it receives. Results are streamed back
+        as they complete rather than collected into a list.
+        
+        Args:
+            texts: The texts to analyze; may be any (lazy) iterable
+            n_jobs: Number of worker processes; defaults to the CPU count
+            chunksize: Texts sent to a worker per task
+            
+        Yields:
+            AnalysisResult objects in the same order as texts
+        """
+        with multiprocessing.Pool(
+            n_jobs or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(self._disk_cache.directory, self._extraction_classes)
+        ) as pool:
+            yield from pool.imap(_analyze_in_worker, texts, chunksize=chunksize)
+    
+    def _get_lx_analyzer(self) -> lx.Analyzer:
+        """Return the langextract analyzer, creating it on first use.
+        
+        The analyzer is built once per instance, under a lock so concurrent
+        first calls from several threads do not each build one.
+        """
+        if self._lx_analyzer is None:
+            with self._lx_analyzer_lock:
+                if self._lx_analyzer is None:
+                    import langextract as lx
+                    
+                    self._lx_analyzer = lx.Analyzer(
+                        examples=self.get_examples(),
+                        description=self.get_prompt_description()
+                    )
+        return self._lx_analyzer
+    
+    def _load_cached(self, text: str) -> Optional[AnalysisResult]:
+        """Return the disk-cached result for a text, or None on a miss."""
+        return self._disk_cache.load(self.get_prompt_description(), text)
+    
+    def _store_cached(self, text: str, result: AnalysisResult) -> AnalysisResult:
+        """Write a result to the disk cache (if enabled) and return it."""
+        return self._disk_cache.store(self.get_prompt_description(), text, result)
+    
+    def _build_result(self, raw_results: lx.data.AnnotatedDocument, sentence_count: int) -> AnalysisResult:
+        """Post-process raw langextract results and add content metadata.
+        
+        Args:
+            raw_results: Raw AnnotatedDocument from langextract
+            sentence_count: Number of sentences in the analyzed text
+            
+        Returns:
+            AnalysisResult with content metadata
+        """
         # Post-process results
         result = self.post_process_results(raw_results)
         
@@ -283,164 +616,128 @@ class ContentAnalyzer(BaseAnalyzer):
         result.add_metadata("analysis_type", "content")
         
         # Calculate content statistics
-        sentences = self._split_sentences(text)
-        result.add_metadata("total_sentences", len(sentences))
+        result.add_metadata("total_sentences", sentence_count)
         
         # Enhance content analysis
-        self._enhance_main_idea_analysis(result)
-        self._enhance_evidence_analysis(result)
-        self._enhance_argument_analysis(result)
-        self._create_content_hierarchy(result)
+        self._build_content_metadata(result)
         
         return result
     
     def _split_sentences(self, text: str) -> List[str]:
         """Simple sentence splitting."""
-        import re
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(_split_text(text))
     
-    def _enhance_main_idea_analysis(self, result: AnalysisResult) -> None:
-        """Enhance main idea analysis with additional insights."""
-        if "main_idea" in result.analysis_data:
-            main_ideas = result.analysis_data["main_idea"]
-            
-            # Count main idea types
-            idea_types = {}
-            for idea in main_ideas:
-                idea_type = idea["attributes"].get("type", "unknown")
-                idea_types[idea_type] = idea_types.get(idea_type, 0) + 1
-            
-            result.add_metadata("main_idea_distribution", idea_types)
-            
-            # Analyze main idea positions
-            positions = {}
-            for idea in main_ideas:
-                position = idea["attributes"].get("position", "unknown")
-                positions[position] = positions.get(position, 0) + 1
+    def _build_content_metadata(self, result: AnalysisResult) -> None:
+        """Add main idea, evidence, argument and hierarchy metadata.
+        
+        Each extraction list is viewed as columns, one per attribute, so
+        the distributions, scores and hierarchy entries are built by
+        C-level map/Counter passes instead of a Python loop per extraction.
+        """
+        data = result.analysis_data
+        hierarchy = ContentHierarchy([], [], [])
+        
+        if "main_idea" in data:
+            main_ideas = data["main_idea"]
+            attributes = list(map(itemgetter("attributes"), main_ideas))
             
-            result.add_metadata("main_idea_positions", positions)
+            # Count main idea types and positions
+            result.add_metadata("main_idea_distribution", dict(Counter(_column(attributes, "type", "unknown"))))
+            result.add_metadata("main_idea_positions", dict(Counter(_column(attributes, "position", "unknown"))))
             
             # Calculate idea density
             total_ideas = len(main_ideas)
             sentences_count = result.metadata.get("total_sentences", 1)
             idea_density = total_ideas / sentences_count if sentences_count > 0 else 0
             result.add_metadata("main_idea_density", round(idea_density, 3))
-    
-    def _enhance_evidence_analysis(self, result: AnalysisResult) -> None:
-        """Enhance evidence analysis with quality assessment."""
-        if "evidence" in result.analysis_data:
-            evidence_items = result.analysis_data["evidence"]
-            
-            # Count evidence types
-            evidence_types = {}
-            for evidence in evidence_items:
-                evidence_type = evidence["attributes"].get("evidence_type", "unknown")
-                evidence_types[evidence_type] = evidence_types.get(evidence_type, 0) + 1
             
-            result.add_metadata("evidence_type_distribution", evidence_types)
-            
-            # Analyze evidence strength
-            strength_counts = {}
-            for evidence in evidence_items:
-                strength = evidence["attributes"].get("strength", "unknown")
-                strength_counts[strength] = strength_counts.get(strength, 0) + 1
+            hierarchy.primary_ideas.extend(map(
+                IdeaEntry,
+                map(itemgetter("text"), main_ideas),
+                _column(attributes, "type", ""),
+                _column(attributes, "position", "")
+            ))
+        
+        if "evidence" in data:
+            evidence_items = data["evidence"]
+            attributes = list(map(itemgetter("attributes"), evidence_items))
+            strengths = _column(attributes, "strength", "unknown")
             
-            result.add_metadata("evidence_strength_distribution", strength_counts)
+            # Count evidence types and strengths
+            result.add_metadata("evidence_type_distribution", dict(Counter(_column(attributes, "evidence_type", "unknown"))))
+            result.add_metadata("evidence_strength_distribution", dict(Counter(strengths)))
             
             # Calculate evidence quality score
-            strength_scores = {"strong": 3, "moderate": 2, "weak": 1}
-            total_score = sum(strength_scores.get(evidence["attributes"].get("strength", ""), 1) 
-                            for evidence in evidence_items)
+            total_score = sum(map(_STRENGTH_SCORES.get, strengths, repeat(1)))
             avg_evidence_quality = total_score / len(evidence_items) if evidence_items else 0
             result.add_metadata("average_evidence_quality", round(avg_evidence_quality, 2))
-    
-    def _enhance_argument_analysis(self, result: AnalysisResult) -> None:
-        """Enhance argument structure analysis."""
-        if "argument_structure" in result.analysis_data:
-            arguments = result.analysis_data["argument_structure"]
             
-            # Count argument components
-            component_counts = {}
-            for arg in arguments:
-                component = arg["attributes"].get("component", "unknown")
-                component_counts[component] = component_counts.get(component, 0) + 1
-            
-            result.add_metadata("argument_component_distribution", component_counts)
-            
-            # Analyze argument types
-            arg_types = {}
-            for arg in arguments:
-                arg_type = arg["attributes"].get("argument_type", "unknown")
-                arg_types[arg_type] = arg_types.get(arg_type, 0) + 1
+            hierarchy.supporting_evidence.extend(map(
+                EvidenceEntry,
+                map(itemgetter("text"), evidence_items),
+                _column(attributes, "evidence_type", ""),
+                _column(attributes, "strength", ""),
+                _column(attributes, "supports", "")
+            ))
+        
+        if "argument_structure" in data:
+            arguments = data["argument_structure"]
+            attributes = list(map(itemgetter("attributes"), arguments))
+            arg_types = _column(attributes, "argument_type", "unknown")
             
-            result.add_metadata("argument_type_distribution", arg_types)
+            # Count argument components and types
+            result.add_metadata("argument_component_distribution", dict(Counter(_column(attributes, "component", "unknown"))))
+            result.add_metadata("argument_type_distribution", dict(Counter(arg_types)))
             
             # Calculate argument complexity
-            complexity_scores = {
-                "assertion": 1,
-                "counterargument_acknowledgment": 3,
-                "refutation": 4,
-                "balanced_perspective": 4
-            }
-            
-            total_complexity = sum(complexity_scores.get(arg["attributes"].get("argument_type", ""), 1) 
-                                 for arg in arguments)
+            total_complexity = sum(map(_ARGUMENT_COMPLEXITY_SCORES.get, arg_types, repeat(1)))
             avg_complexity = total_complexity / len(arguments) if arguments else 0
             result.add_metadata("argument_complexity_score", round(avg_complexity, 2))
-    
-    def _create_content_hierarchy(self, result: AnalysisResult) -> None:
-        """Create hierarchical outline of content structure."""
-        hierarchy = {
-            "primary_ideas": [],
-            "secondary_details": [],
-            "supporting_evidence": []
-        }
-        
-        # Organize main ideas
-        if "main_idea" in result.analysis_data:
-            for idea in result.analysis_data["main_idea"]:
-                hierarchy["primary_ideas"].append({
-                    "text": idea["text"],
-                    "type": idea["attributes"].get("type", ""),
-                    "position": idea["attributes"].get("position", "")
-                })
         
         # Organize supporting details
-        if "supporting_detail" in result.analysis_data:
-            for detail in result.analysis_data["supporting_detail"]:
-                hierarchy["secondary_details"].append({
-                    "text": detail["text"],
-                    "type": detail["attributes"].get("type", ""),
-                    "relates_to": detail["attributes"].get("relates_to", "")
-                })
-        
-        # Organize evidence
-        if "evidence" in result.analysis_data:
-            for evidence in result.analysis_data["evidence"]:
-                hierarchy["supporting_evidence"].append({
-                    "text": evidence["text"],
-                    "type": evidence["attributes"].get("evidence_type", ""),
-                    "strength": evidence["attributes"].get("strength", ""),
-                    "supports": evidence["attributes"].get("supports", "")
-                })
-        
-        result.add_metadata("content_hierarchy", hierarchy)
+        if "supporting_detail" in data:
+            details = data["supporting_detail"]
+            attributes = list(map(itemgetter("attributes"), details))
+            hierarchy.secondary_details.extend(map(
+                DetailEntry,
+                map(itemgetter("text"), details),
+                _column(attributes, "type", ""),
+                _column(attributes, "relates_to", "")
+            ))
+        
+        result.add_metadata("content_hierarchy", hierarchy.to_dict())
     
     def validate_text(self, text: str) -> bool:
         """Validate if text is suitable for content analysis."""
+        return self._validate_and_split(text)[0]
+    
+    def _validate_and_split(self, text: str) -> Tuple[bool, Tuple[str, ...]]:
+        """Validate text and return its sentences, splitting it only once.
+        
+        Args:
+            text: Text to validate
+            
+        Returns:
+            Tuple of (whether the text can be analyzed, its sentences)
+        """
         if not super().validate_text(text):
-            return False
+            return False, ()
         
         # Content analysis needs at least 2 sentences with substantial content
-        sentences = self._split_sentences(text)
-        return len(sentences) >= 2 and sum(len(s.split()) for s in sentences) >= 20
+        sentences = _split_text(text)
+        is_valid = len(sentences) >= 2 and sum(len(s.split()) for s in sentences) >= 20
+        return is_valid, sentences
     
     def get_configuration_schema(self) -> Dict[str, Any]:
         """Return configuration schema for content analyzer."""
         base_schema = super().get_configuration_schema()
         
         content_schema = {
+            "extraction_classes": {
+                "type": "array",
+                "default": list(EXTRACTION_CLASSES),
+                "description": "Extraction classes requested from the model; omit unused ones to shorten prompts and output"
+            },
             "analyze_main_ideas": {
                 "type": "boolean",
                 "default": True,
@@ -479,4 +776,20 @@ class ContentAnalyzer(BaseAnalyzer):
         }
         
         base_schema.update(content_schema)
-        return base_schema
\ No newline at end of file
+        return base_schema
+
+
+# Analyzer owned by each analyze_parallel() worker process
+_WORKER_ANALYZER: Optional[ContentAnalyzer] = None
+
+
+def _init_worker(cache_dir: Optional[Path], extraction_classes: Tuple[str, ...]) -> None:
+    """Create the worker process's analyzer once, when the pool starts."""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = ContentAnalyzer(cache_dir=cache_dir, extraction_classes=extraction_classes)
+    _WORKER_ANALYZER._get_lx_analyzer()
+
+
+def _analyze_in_worker(text: str) -> AnalysisResult:
+    """Analyze one text with the worker process's analyzer."""
+    return _WORKER_ANALYZER.analyze(text)
@@ -1,9 +1,105 @@
 """Grammar analyzer for English text analysis."""
 
-from typing import List, Dict, Any
-import langextract as lx
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Any, ClassVar, Iterable, Optional, Tuple, Union
+import re
+import threading
 
 from ..core.base_analyzer import BaseAnalyzer, AnalysisResult
+from ..core.result_cache import DiskResultCache, MemoryResultCache
+
+if TYPE_CHECKING:
+    import langextract as lx
+
+
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Three whitespace-separated words with no sentence delimiter between them,
+# i.e. a sentence that would split into at least three words. The
+# lookbehind only lets a match start at the beginning of a word.
+_THREE_WORD_SENTENCE_RE = re.compile(r'(?<![^.!?\s])[^.!?\s]+\s+[^.!?\s]+\s+[^.!?\s]')
+
+# Bump when the pickled result layout changes to invalidate disk cache entries
+_CACHE_VERSION = 2
+
+# Complexity score per tense; unknown tenses score 1
+_TENSE_COMPLEXITY = {
+    "present_simple": 1,
+    "past_simple": 1,
+    "future_simple": 2,
+    "present_continuous": 2,
+    "past_continuous": 3,
+    "present_perfect": 3,
+    "past_perfect": 4,
+    "present_perfect_continuous": 4,
+    "conditional_perfect": 5
+}
+
+# Complexity score per sentence type; unknown types score 1
+_SENTENCE_COMPLEXITY = {
+    "simple": 1,
+    "compound": 2,
+    "complex": 3,
+    "compound_complex": 4
+}
+
+# Syntactic complexity weight per clause type; unknown types weigh 1
+_DEPENDENCY_WEIGHTS = {
+    "relative_clause": 3,
+    "adverbial_clause": 2,
+    "nominal_clause": 2,
+    "conditional_clause": 4,
+    "participial_clause": 3
+}
+
+# Difficulty of complex structures for Korean learners; others are "중급"
+_DIFFICULTY_LEVELS = {
+    "perfect_participle_clause": "고급",
+    "third_conditional": "고급",
+    "gerund_construction": "중급",
+    "infinitive_construction": "중급",
+    "passive_construction": "중급",
+    "reported_speech": "고급"
+}
+
+# Common errors Korean learners make with complex structures
+_COMMON_ERRORS = {
+    "third_conditional": "시제 일치 오류, would of 대신 would have 사용",
+    "perfect_participle_clause": "분사구문의 주어 일치 문제",
+    "passive_construction": "by 전치사 생략 오류"
+}
+
+# (difficulty, common error) per structure type, so each structure needs one lookup
+_STRUCTURE_NOTES = {
+    structure_type: (_DIFFICULTY_LEVELS.get(structure_type, "중급"), _COMMON_ERRORS.get(structure_type))
+    for structure_type in {**_DIFFICULTY_LEVELS, **_COMMON_ERRORS}
+}
+_DEFAULT_STRUCTURE_NOTES = ("중급", None)
+
+
+def _count_and_score(items: List[Dict[str, Any]], key: str, scores: Dict[str, int]) -> Tuple[Counter, int]:
+    """Count an attribute's labels and sum their scores (unknown labels score 1).
+    
+    The labels are counted in C by Counter, then each distinct label is
+    scored once and weighted by its count, instead of looking up a score
+    for every extraction.
+    """
+    counts = Counter(attributes.get(key, "unknown") for attributes in map(itemgetter("attributes"), items))
+    return counts, sum(scores.get(label, 1) * count for label, count in counts.items())
+
+
+def _split_text(text: str) -> Tuple[str, ...]:
+    """Split text into stripped, non-empty sentences.
+    
+    validate_text() only scans for a long enough sentence, so a text is
+    split once per analysis.
+    """
+    return tuple(s for s in (part.strip() for part in _SENT_RE.split(text)) if s)
 
 
 class GrammarAnalyzer(BaseAnalyzer):
@@ -13,11 +109,43 @@ class GrammarAnalyzer(BaseAnalyzer):
     clause structures, and complex grammatical patterns.
     """
     
-    def __init__(self):
+    # Examples, prompt and schema are static, so they are built once per process
+    _shared_examples: ClassVar[Optional[List[lx.data.ExampleData]]] = None
+    _shared_prompt_description: ClassVar[Optional[str]] = None
+    _shared_configuration_schema: ClassVar[Optional[Dict[str, Any]]] = None
+    
+    def __init__(self, cache_size: int = 128, cache_dir: Optional[Union[str, Path]] = None):
+        """Initialize the grammar analyzer.
+        
+        Args:
+            cache_size: Maximum number of memoized analyses kept in memory
+            cache_dir: Directory for the persistent result cache, e.g.
+                ~/.cache/english_text_analyzer/grammar. Results are not
+                cached on disk when None.
+        """
         super().__init__("grammar")
+        # Memoize full analyses per instance; identical passages are common
+        self._memory_cache = MemoryResultCache(cache_size)
+        self._disk_cache = DiskResultCache(cache_dir, "grammar", _CACHE_VERSION)
+        self._lx_analyzer = None
+        self._lx_analyzer_lock = threading.Lock()
     
     def get_examples(self) -> List[lx.data.ExampleData]:
-        """Return example data for grammar analysis."""
+        """Return example data for grammar analysis.
+        
+        The examples are built once per process and shared by all instances.
+        """
+        if self._examples is None:
+            if GrammarAnalyzer._shared_examples is None:
+                GrammarAnalyzer._shared_examples = self._build_examples()
+            self._examples = GrammarAnalyzer._shared_examples
+        return self._examples
+    
+    def _build_examples(self) -> List[lx.data.ExampleData]:
+        """Build the langextract example data for grammar analysis."""
+        # Imported here so that importing this module does not load langextract
+        import langextract as lx
+        
         return [
             lx.data.ExampleData(
                 text="Having completed the research, the team published their findings.",
@@ -240,6 +368,14 @@ class GrammarAnalyzer(BaseAnalyzer):
     
     def get_prompt_description(self) -> str:
         """Return the prompt description for grammar analysis."""
+        if self._prompt_description is None:
+            if GrammarAnalyzer._shared_prompt_description is None:
+                GrammarAnalyzer._shared_prompt_description = self._build_prompt_description()
+            self._prompt_description = GrammarAnalyzer._shared_prompt_description
+        return self._prompt_description
+    
+    def _build_prompt_description(self) -> str:
+        """Build the prompt description for grammar analysis."""
         return """
         Analyze the grammatical structures in the given English text and extract the following information:
 
@@ -284,23 +420,91 @@ class GrammarAnalyzer(BaseAnalyzer):
         """
     
     def analyze(self, text: str) -> AnalysisResult:
-        """Perform grammar analysis on the given text."""
+        """Perform grammar analysis on the given text.
+        
+        Results are memoized by text, so re-analyzing an identical passage
+        returns a copy of the cached AnalysisResult without another model
+        call. Callers may modify the returned result freely.
+        
+        Args:
+            text: The text to analyze
+            
+        Returns:
+            AnalysisResult containing grammar analysis
+        """
         if not self.validate_text(text):
             raise ValueError("Text is not suitable for grammar analysis")
         
-        # Use langextract to perform the analysis
-        examples = self.get_examples()
-        prompt_description = self.get_prompt_description()
+        result = self._lookup_cached(text)
+        if result is not None:
+            return result
+        
+        # Perform analysis with the shared langextract analyzer
+        raw_results = self._get_lx_analyzer().analyze(text)
+        
+        return self._remember(text, self._build_result(text, raw_results))
+    
+    def clear_cache(self) -> None:
+        """Clear memoized analysis results."""
+        self._memory_cache.clear()
+    
+    def _lookup_cached(self, text: str) -> Optional[AnalysisResult]:
+        """Return a cached result from memory, then from disk, or None on a miss."""
+        result = self._memory_cache.get(text)
+        if result is None:
+            result = self._load_cached(text)
+            if result is not None:
+                self._memory_cache.put(text, result)
+        return result
+    
+    def _remember(self, text: str, result: AnalysisResult) -> AnalysisResult:
+        """Store a newly built result in the memory and disk caches and return it."""
+        return self._memory_cache.put(text, self._store_cached(text, result))
+    
+    def analyze_batch(self, texts: Iterable[str], max_workers: Optional[int] = None) -> List[AnalysisResult]:
+        """Perform grammar analysis on several texts.
+        
+        Texts are submitted to langextract in one batched call when the
+        analyzer supports it; otherwise the model calls, which spend most
+        of their time waiting on the model, run concurrently on a thread
+        pool. Texts found in the in-memory or disk cache are not sent to the
+        model, and new results are cached for later analyze() calls.
+        
+        Args:
+            texts: The texts to analyze
+            max_workers: Thread pool size when langextract has no batch
+                API; ThreadPoolExecutor's default when None
+            
+        Returns:
+            AnalysisResult objects in the same order as texts
+        """
+        texts = list(texts)
+        for text in texts:
+            if not self.validate_text(text):
+                raise ValueError("Text is not suitable for grammar analysis")
         
-        # Create langextract analyzer
-        analyzer = lx.Analyzer(
-            examples=examples,
-            description=prompt_description
-        )
+        results = [self._lookup_cached(text) for text in texts]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
         
-        # Perform analysis
-        raw_results = analyzer.analyze(text)
+        analyzer = self._get_lx_analyzer()
+        analyze_many = getattr(analyzer, "analyze_batch", None)
+        pending_texts = [texts[i] for i in pending]
+        if analyze_many is not None:
+            raw_batch = analyze_many(pending_texts)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                raw_batch = list(executor.map(analyzer.analyze, pending_texts))
         
+        # Post-processing is pure Python, so it stays on this thread
+        for i, raw_results in zip(pending, raw_batch):
+            results[i] = self._remember(texts[i], self._build_result(texts[i], raw_results))
+        
+        return results
+    
+    def _build_result(self, text: str, raw_results: lx.data.AnnotatedDocument) -> AnalysisResult:
+        """Build the grammar AnalysisResult for a text from raw extractions."""
         # Post-process results
         result = self.post_process_results(raw_results)
         
@@ -308,7 +512,7 @@ class GrammarAnalyzer(BaseAnalyzer):
         result.add_metadata("analysis_type", "grammar")
         
         # Calculate sentence statistics
-        sentences = self._split_sentences(text)
+        sentences = _split_text(text)
         result.add_metadata("total_sentences", len(sentences))
         result.add_metadata("average_sentence_length", 
                           sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0)
@@ -321,41 +525,46 @@ class GrammarAnalyzer(BaseAnalyzer):
         
         return result
     
+    def _get_lx_analyzer(self) -> lx.Analyzer:
+        """Return the langextract analyzer, creating it on first use.
+        
+        The analyzer is built once per instance, under a lock so concurrent
+        first calls from several threads do not each build one.
+        """
+        if self._lx_analyzer is None:
+            with self._lx_analyzer_lock:
+                if self._lx_analyzer is None:
+                    import langextract as lx
+                    
+                    self._lx_analyzer = lx.Analyzer(
+                        examples=self.get_examples(),
+                        description=self.get_prompt_description()
+                    )
+        return self._lx_analyzer
+    
+    def _load_cached(self, text: str) -> Optional[AnalysisResult]:
+        """Return the disk-cached result for a text, or None on a miss."""
+        return self._disk_cache.load(self.get_prompt_description(), text)
+    
+    def _store_cached(self, text: str, result: AnalysisResult) -> AnalysisResult:
+        """Write a result to the disk cache (if enabled) and return it."""
+        return self._disk_cache.store(self.get_prompt_description(), text, result)
+    
     def _split_sentences(self, text: str) -> List[str]:
         """Simple sentence splitting (can be enhanced with proper NLP tools)."""
-        import re
         # Simple sentence splitting - in real implementation, use proper sentence tokenizer
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(_split_text(text))
     
     def _enhance_tense_analysis(self, result: AnalysisResult) -> None:
         """Enhance tense analysis with additional patterns."""
         if "verb_tense" in result.analysis_data:
             tenses = result.analysis_data["verb_tense"]
             
-            # Count tense distribution
-            tense_counts = {}
-            for tense_info in tenses:
-                tense = tense_info["attributes"].get("tense", "unknown")
-                tense_counts[tense] = tense_counts.get(tense, 0) + 1
+            # Count tense distribution and score tense complexity
+            tense_counts, total_complexity = _count_and_score(tenses, "tense", _TENSE_COMPLEXITY)
             
-            result.add_metadata("tense_distribution", tense_counts)
+            result.add_metadata("tense_distribution", dict(tense_counts))
             
-            # Add complexity scoring for tenses
-            complexity_scores = {
-                "present_simple": 1,
-                "past_simple": 1,
-                "future_simple": 2,
-                "present_continuous": 2,
-                "past_continuous": 3,
-                "present_perfect": 3,
-                "past_perfect": 4,
-                "present_perfect_continuous": 4,
-                "conditional_perfect": 5
-            }
-            
-            total_complexity = sum(complexity_scores.get(tense_info["attributes"].get("tense", ""), 1) 
-                                 for tense_info in tenses)
             avg_complexity = total_complexity / len(tenses) if tenses else 0
             result.add_metadata("tense_complexity_score", round(avg_complexity, 2))
     
@@ -364,24 +573,11 @@ class GrammarAnalyzer(BaseAnalyzer):
         if "sentence_type" in result.analysis_data:
             sentence_types = result.analysis_data["sentence_type"]
             
-            # Count sentence type distribution
-            type_counts = {}
-            for sentence_info in sentence_types:
-                sentence_type = sentence_info["attributes"].get("type", "unknown")
-                type_counts[sentence_type] = type_counts.get(sentence_type, 0) + 1
+            # Count sentence type distribution and score complexity
+            type_counts, total_complexity = _count_and_score(sentence_types, "type", _SENTENCE_COMPLEXITY)
             
-            result.add_metadata("sentence_type_distribution", type_counts)
+            result.add_metadata("sentence_type_distribution", dict(type_counts))
             
-            # Calculate complexity score
-            complexity_scores = {
-                "simple": 1,
-                "compound": 2,
-                "complex": 3,
-                "compound_complex": 4
-            }
-            
-            total_complexity = sum(complexity_scores.get(sentence_info["attributes"].get("type", ""), 1) 
-                                 for sentence_info in sentence_types)
             avg_complexity = total_complexity / len(sentence_types) if sentence_types else 0
             result.add_metadata("sentence_complexity_score", round(avg_complexity, 2))
     
@@ -393,30 +589,17 @@ class GrammarAnalyzer(BaseAnalyzer):
         complex_structures = result.analysis_data["complex_structure"]
         
         # Add complexity scoring and educational insights
-        for structure in complex_structures:
-            structure_type = structure["attributes"].get("structure_type", "")
+        for attributes in map(itemgetter("attributes"), complex_structures):
+            difficulty, common_errors = _STRUCTURE_NOTES.get(
+                attributes.get("structure_type", ""), _DEFAULT_STRUCTURE_NOTES
+            )
             
             # Add difficulty level for Korean learners
-            difficulty_levels = {
-                "perfect_participle_clause": "고급",
-                "third_conditional": "고급",
-                "gerund_construction": "중급",
-                "infinitive_construction": "중급",
-                "passive_construction": "중급",
-                "reported_speech": "고급"
-            }
-            
-            structure["attributes"]["difficulty_for_korean_learners"] = difficulty_levels.get(structure_type, "중급")
+            attributes["difficulty_for_korean_learners"] = difficulty
             
             # Add common errors for Korean learners
-            common_errors = {
-                "third_conditional": "시제 일치 오류, would of 대신 would have 사용",
-                "perfect_participle_clause": "분사구문의 주어 일치 문제",
-                "passive_construction": "by 전치사 생략 오류"
-            }
-            
-            if structure_type in common_errors:
-                structure["attributes"]["common_korean_errors"] = common_errors[structure_type]
+            if common_errors is not None:
+                attributes["common_korean_errors"] = common_errors
     
     def _analyze_dependency_relationships(self, result: AnalysisResult) -> None:
         """Analyze dependency relationships between clauses and phrases."""
@@ -424,25 +607,11 @@ class GrammarAnalyzer(BaseAnalyzer):
         if "clause_structure" in result.analysis_data:
             clauses = result.analysis_data["clause_structure"]
             
-            # Count different types of dependencies
-            dependency_counts = {}
-            for clause in clauses:
-                clause_type = clause["attributes"].get("clause_type", "unknown")
-                dependency_counts[clause_type] = dependency_counts.get(clause_type, 0) + 1
+            # Count different types of dependencies and weigh their complexity
+            dependency_counts, total_complexity = _count_and_score(clauses, "clause_type", _DEPENDENCY_WEIGHTS)
             
-            result.add_metadata("dependency_distribution", dependency_counts)
+            result.add_metadata("dependency_distribution", dict(dependency_counts))
             
-            # Calculate syntactic complexity based on dependencies
-            complexity_weights = {
-                "relative_clause": 3,
-                "adverbial_clause": 2,
-                "nominal_clause": 2,
-                "conditional_clause": 4,
-                "participial_clause": 3
-            }
-            
-            total_complexity = sum(complexity_weights.get(clause["attributes"].get("clause_type", ""), 1) 
-                                 for clause in clauses)
             result.add_metadata("syntactic_complexity_score", total_complexity)
     
     def validate_text(self, text: str) -> bool:
@@ -450,12 +619,25 @@ class GrammarAnalyzer(BaseAnalyzer):
         if not super().validate_text(text):
             return False
         
-        # Grammar analysis needs at least one complete sentence
-        sentences = self._split_sentences(text)
-        return len(sentences) >= 1 and any(len(s.split()) >= 3 for s in sentences)
+        # Grammar analysis needs at least one sentence of three or more words;
+        # scan for the first one instead of splitting the whole text
+        return _THREE_WORD_SENTENCE_RE.search(text) is not None
     
     def get_configuration_schema(self) -> Dict[str, Any]:
-        """Return configuration schema for grammar analyzer."""
+        """Return configuration schema for grammar analyzer.
+        
+        The schema is built once per process; each call returns a copy so
+        callers may modify it freely.
+        """
+        if GrammarAnalyzer._shared_configuration_schema is None:
+            GrammarAnalyzer._shared_configuration_schema = self._build_configuration_schema()
+        return {
+            key: dict(spec)
+            for key, spec in GrammarAnalyzer._shared_configuration_schema.items()
+        }
+    
+    def _build_configuration_schema(self) -> Dict[str, Any]:
+        """Build the configuration schema for grammar analyzer."""
         base_schema = super().get_configuration_schema()
         
         grammar_schema = {
@@ -488,6 +670,16 @@ class GrammarAnalyzer(BaseAnalyzer):
                 "type": "boolean",
                 "default": True,
                 "description": "Include Korean educational explanations"
+            },
+            "cache_size": {
+                "type": "integer",
+                "default": 128,
+                "description": "Maximum number of memoized analyses per analyzer"
+            },
+            "cache_dir": {
+                "type": "string",
+                "default": None,
+                "description": "Directory for the persistent result cache (disabled when unset)"
             }
         }
         
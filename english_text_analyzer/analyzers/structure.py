@@ -1,9 +1,223 @@
 """Structure analyzer for English text analysis."""
 
-from typing import List, Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import List, Dict, Any, ClassVar, Iterable, Optional, Tuple
+import math
+import re
+import threading
 import langextract as lx
 
-from ..core.base_analyzer import BaseAnalyzer, AnalysisResult
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; transition scanning falls back to re
+    hyperscan = None
+
+from ..core.base_analyzer import BaseAnalyzer, AnalysisResult, select_extraction_classes
+
+
+_SENT_RE = re.compile(r'[.!?]+')
+# Folds every sentence delimiter into '.', for the ASCII str.split() fast path
+_SENT_DELIMITERS = str.maketrans({'!': '.', '?': '.'})
+# A paragraph break is a blank line, which may hold spaces, tabs or \r
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Extraction classes the structure prompt can request, in prompt order
+EXTRACTION_CLASSES = (
+    "topic_sentence",
+    "transition_marker",
+    "paragraph_structure",
+    "cohesion_device",
+    "discourse_pattern"
+)
+
+# Prompt section (title, then detail lines) for each extraction class
+_PROMPT_SECTIONS = {
+    "topic_sentence": (
+        "**Topic Sentences**: Identify sentences that introduce main ideas",
+        "- Position: opening, middle, closing",
+        "- Function: thesis_statement, topic_introduction, summary",
+        "- Paragraph number",
+        "- Provide Korean educational notes",
+    ),
+    "transition_marker": (
+        "**Transition Markers**: Identify words and phrases that connect ideas",
+        "- Type: sequence, contrast, cause_effect, addition, conclusion, concession",
+        "- Function: specific purpose (enumeration, opposition, consequence, etc.)",
+        "- Position: sentence_initial, sentence_medial, sentence_final",
+        "- Include Korean explanations of usage",
+    ),
+    "paragraph_structure": (
+        "**Paragraph Structure**: Analyze organizational patterns",
+        "- Pattern: topic_sentence_plus_supporting_details, general_to_specific, specific_to_general, chronological, spatial",
+        "- Organization: enumeration, comparison_contrast, cause_effect, problem_solution",
+        "- Coherence score: high, medium, low",
+        "- Provide structural analysis in Korean",
+    ),
+    "cohesion_device": (
+        "**Cohesion Devices**: Identify elements that create text unity",
+        "- Type: reference (pronouns, demonstratives), substitution, ellipsis, lexical_cohesion",
+        "- Refers_to: what the cohesive device points back to",
+        "- Cohesion_type: reference, substitution, conjunction, lexical",
+        "- Include Korean explanations",
+    ),
+    "discourse_pattern": (
+        "**Discourse Patterns**: Identify larger rhetorical structures",
+        "- Pattern: argument_counterargument, problem_solution, cause_effect_chain, comparison_contrast",
+        "- Rhetorical_function: persuasive, explanatory, descriptive, narrative",
+        "- Include analysis of effectiveness",
+    ),
+}
+
+# Unambiguous transition markers and their (type, function) when they open a
+# sentence and are followed by a comma, e.g. "However, ..."
+_TRANSITION_LEXICON = {
+    "first": ("sequence", "enumeration"),
+    "firstly": ("sequence", "enumeration"),
+    "second": ("sequence", "enumeration"),
+    "secondly": ("sequence", "enumeration"),
+    "third": ("sequence", "enumeration"),
+    "thirdly": ("sequence", "enumeration"),
+    "next": ("sequence", "enumeration"),
+    "finally": ("conclusion", "final_point"),
+    "lastly": ("conclusion", "final_point"),
+    "however": ("contrast", "opposition"),
+    "in contrast": ("contrast", "opposition"),
+    "conversely": ("contrast", "opposition"),
+    "on the other hand": ("contrast", "alternative_viewpoint"),
+    "nevertheless": ("concession", "despite_opposition"),
+    "nonetheless": ("concession", "despite_opposition"),
+    "even so": ("concession", "despite_opposition"),
+    "therefore": ("cause_effect", "logical_conclusion"),
+    "thus": ("cause_effect", "logical_conclusion"),
+    "hence": ("cause_effect", "logical_conclusion"),
+    "as a result": ("cause_effect", "consequence"),
+    "consequently": ("cause_effect", "consequence"),
+    "moreover": ("addition", "additional_point"),
+    "furthermore": ("addition", "additional_point"),
+    "in addition": ("addition", "additional_point"),
+    "additionally": ("addition", "additional_point"),
+    "in conclusion": ("conclusion", "summary_introduction"),
+    "to conclude": ("conclusion", "summary_introduction"),
+    "in summary": ("conclusion", "summary_introduction"),
+    "to sum up": ("conclusion", "summary_introduction"),
+}
+_TRANSITION_PATTERNS = [
+    r'\b' + r'\s+'.join(phrase.split()) + r'\b' for phrase in _TRANSITION_LEXICON
+]
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Build a regex that matches any of the phrases, factored as a trie.
+    
+    Phrases sharing a prefix share one branch ("in\\s+(?:addition|contrast)"),
+    so the regex engine tests each character position against one branch
+    per distinct next character instead of against every phrase. Spaces
+    match any run of whitespace.
+    """
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [
+            (r'\s+' if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+    
+    return r'\b' + build(trie) + r'\b'
+
+
+# The re fallback scans for all phrases with one trie-factored pattern
+_TRANSITION_RE = re.compile(_trie_pattern(_TRANSITION_LEXICON), re.IGNORECASE)
+
+
+def _compile_transition_database() -> Optional["hyperscan.Database"]:
+    """Compile the transition lexicon into a Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode('ascii') for pattern in _TRANSITION_PATTERNS],
+            ids=list(range(len(_TRANSITION_PATTERNS))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_CASELESS] * len(_TRANSITION_PATTERNS)
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_TRANSITION_DATABASE = _compile_transition_database()
+
+# Hyperscan scratch space must not be shared between threads
+_hyperscan_local = threading.local()
+
+
+def _transition_spans(text: str) -> List[Tuple[int, int]]:
+    """Return (start, end) offsets of lexicon phrases in the text, in order.
+    
+    Uses one Hyperscan DFA scan when it is installed and the text is ASCII
+    (so byte and character offsets agree); otherwise scans with re.
+    """
+    if _TRANSITION_DATABASE is not None and text.isascii():
+        scratch = getattr(_hyperscan_local, 'scratch', None)
+        if scratch is None:
+            scratch = _hyperscan_local.scratch = hyperscan.Scratch(_TRANSITION_DATABASE)
+        spans = []
+        _TRANSITION_DATABASE.scan(
+            text.encode('ascii'),
+            match_event_handler=lambda _id, start, end, _flags, _context: spans.append((start, end)),
+            scratch=scratch
+        )
+        return sorted(spans)
+    
+    return [match.span() for match in _TRANSITION_RE.finditer(text)]
+
+
+def _find_transition_markers(text: str) -> List[Dict[str, Any]]:
+    """Find sentence-initial lexicon transition markers followed by a comma.
+    
+    Returns:
+        Extractions in the post_process_results() layout, tagged with
+        source "lexicon"
+    """
+    markers = []
+    for start, end in _transition_spans(text):
+        if text[end:end + 1] != ",":
+            continue
+        
+        # Only the first word of a sentence (or of the text) counts
+        before = start - 1
+        while before >= 0 and text[before].isspace():
+            before -= 1
+        if before >= 0 and text[before] not in ".!?":
+            continue
+        
+        marker_text = text[start:end]
+        marker_type, function = _TRANSITION_LEXICON[" ".join(marker_text.lower().split())]
+        markers.append({
+            "text": marker_text,
+            "attributes": {
+                "type": marker_type,
+                "function": function,
+                "position": "sentence_initial",
+                "source": "lexicon"
+            },
+            "start_index": start,
+            "end_index": end
+        })
+    return markers
 
 
 class StructureAnalyzer(BaseAnalyzer):
@@ -13,11 +227,65 @@ class StructureAnalyzer(BaseAnalyzer):
     transition markers, discourse patterns, and coherence relationships.
     """
     
-    def __init__(self):
+    # Examples, prompt and schema are static, so they are built once per process
+    _shared_examples: ClassVar[Optional[List[lx.data.ExampleData]]] = None
+    _shared_prompt_description: ClassVar[Optional[str]] = None
+    _shared_configuration_schema: ClassVar[Optional[Dict[str, Any]]] = None
+    
+    def __init__(
+        self,
+        lexicon_transitions: bool = False,
+        extraction_classes: Optional[Iterable[str]] = None
+    ):
+        """Initialize the structure analyzer.
+        
+        Args:
+            lexicon_transitions: Also detect unambiguous sentence-initial
+                transition markers ("However," "As a result,") with a
+                local lexicon scan, so they are reported even when the
+                model misses them
+            extraction_classes: Extraction classes to request from the
+                model (see EXTRACTION_CLASSES); all of them when None.
+                Leaving out unneeded classes shortens the prompt, the
+                examples and the model output.
+        """
         super().__init__("structure")
+        self._extraction_classes = select_extraction_classes(
+            extraction_classes, EXTRACTION_CLASSES, "structure"
+        )
+        self._lexicon_transitions = lexicon_transitions
+        self._lx_analyzer = None
+        self._lx_analyzer_lock = threading.Lock()
     
     def get_examples(self) -> List[lx.data.ExampleData]:
-        """Return example data for structure analysis."""
+        """Return example data for structure analysis.
+        
+        The examples for the default extraction classes are built once per
+        process and shared by all instances.
+        """
+        if self._examples is None:
+            if self._extraction_classes != EXTRACTION_CLASSES:
+                self._examples = self._select_examples(self._build_examples())
+            else:
+                if StructureAnalyzer._shared_examples is None:
+                    StructureAnalyzer._shared_examples = self._build_examples()
+                self._examples = StructureAnalyzer._shared_examples
+        return self._examples
+    
+    def _select_examples(self, examples: List[lx.data.ExampleData]) -> List[lx.data.ExampleData]:
+        """Keep only extractions of the selected classes, dropping emptied examples."""
+        selected = []
+        for example in examples:
+            extractions = [
+                extraction for extraction in example.extractions
+                if extraction.extraction_class in self._extraction_classes
+            ]
+            if extractions:
+                selected.append(lx.data.ExampleData(text=example.text, extractions=extractions))
+        return selected
+    
+    def _build_examples(self) -> List[lx.data.ExampleData]:
+        """Build the langextract example data for structure analysis."""
         return [
             lx.data.ExampleData(
                 text="Climate change is one of the most pressing issues of our time. First, rising temperatures are causing ice caps to melt. Second, this leads to rising sea levels. Finally, coastal communities face increasing flood risks.",
@@ -201,69 +469,118 @@ class StructureAnalyzer(BaseAnalyzer):
     
     def get_prompt_description(self) -> str:
         """Return the prompt description for structure analysis."""
-        return """
-        Analyze the structural and organizational patterns in the given English text and extract the following information:
-
-        1. **Topic Sentences**: Identify sentences that introduce main ideas
-           - Position: opening, middle, closing
-           - Function: thesis_statement, topic_introduction, summary
-           - Paragraph number
-           - Provide Korean educational notes
-
-        2. **Transition Markers**: Identify words and phrases that connect ideas
-           - Type: sequence, contrast, cause_effect, addition, conclusion, concession
-           - Function: specific purpose (enumeration, opposition, consequence, etc.)
-           - Position: sentence_initial, sentence_medial, sentence_final
-           - Include Korean explanations of usage
-
-        3. **Paragraph Structure**: Analyze organizational patterns
-           - Pattern: topic_sentence_plus_supporting_details, general_to_specific, specific_to_general, chronological, spatial
-           - Organization: enumeration, comparison_contrast, cause_effect, problem_solution
-           - Coherence score: high, medium, low
-           - Provide structural analysis in Korean
-
-        4. **Cohesion Devices**: Identify elements that create text unity
-           - Type: reference (pronouns, demonstratives), substitution, ellipsis, lexical_cohesion
-           - Refers_to: what the cohesive device points back to
-           - Cohesion_type: reference, substitution, conjunction, lexical
-           - Include Korean explanations
-
-        5. **Discourse Patterns**: Identify larger rhetorical structures
-           - Pattern: argument_counterargument, problem_solution, cause_effect_chain, comparison_contrast
-           - Rhetorical_function: persuasive, explanatory, descriptive, narrative
-           - Include analysis of effectiveness
-
-        Focus on structural elements that help Korean learners understand how English texts are organized.
-        Provide detailed Korean explanations to help understand text flow and logical connections.
-        """
+        if self._prompt_description is None:
+            if self._extraction_classes != EXTRACTION_CLASSES:
+                self._prompt_description = self._build_prompt_description()
+            else:
+                if StructureAnalyzer._shared_prompt_description is None:
+                    StructureAnalyzer._shared_prompt_description = self._build_prompt_description()
+                self._prompt_description = StructureAnalyzer._shared_prompt_description
+        return self._prompt_description
+    
+    def _build_prompt_description(self) -> str:
+        """Build the prompt description for the selected extraction classes."""
+        lines = [
+            "",
+            "        Analyze the structural and organizational patterns in the given English text "
+            "and extract the following information:",
+        ]
+        selected = [_PROMPT_SECTIONS[name] for name in self._extraction_classes]
+        for number, (title, *details) in enumerate(selected, 1):
+            lines.append("")
+            lines.append(f"        {number}. {title}")
+            lines.extend(f"           {detail}" for detail in details)
+        lines.extend([
+            "",
+            "        Focus on structural elements that help Korean learners understand how English texts "
+            "are organized.",
+            "        Provide detailed Korean explanations to help understand text flow "
+            "and logical connections.",
+            "        ",
+        ])
+        return "\n".join(lines)
     
     def analyze(self, text: str) -> AnalysisResult:
         """Perform structure analysis on the given text."""
-        if not self.validate_text(text):
+        is_valid, sentences = self._validate_and_split(text)
+        if not is_valid:
             raise ValueError("Text is not suitable for structure analysis")
         
-        # Use langextract to perform the analysis
-        examples = self.get_examples()
-        prompt_description = self.get_prompt_description()
+        # Perform analysis with the shared langextract analyzer
+        raw_results = self._get_lx_analyzer().analyze(text)
         
-        # Create langextract analyzer
-        analyzer = lx.Analyzer(
-            examples=examples,
-            description=prompt_description
-        )
+        return self._build_result(text, sentences, raw_results)
+    
+    def analyze_batch(self, texts: Iterable[str], max_workers: Optional[int] = None) -> List[AnalysisResult]:
+        """Perform structure analysis on several texts.
         
-        # Perform analysis
-        raw_results = analyzer.analyze(text)
+        The langextract analyzer is set up once for the whole batch. Texts
+        are submitted in one batched call when it supports that; otherwise
+        the model calls, which spend most of their time waiting on the
+        model, run concurrently on a thread pool.
+        
+        Args:
+            texts: The texts to analyze
+            max_workers: Thread pool size when langextract has no batch
+                API; ThreadPoolExecutor's default when None
+            
+        Returns:
+            AnalysisResult objects in the same order as texts
+        """
+        texts = list(texts)
+        sentence_lists = []
+        for text in texts:
+            is_valid, sentences = self._validate_and_split(text)
+            if not is_valid:
+                raise ValueError("Text is not suitable for structure analysis")
+            sentence_lists.append(sentences)
+        
+        analyzer = self._get_lx_analyzer()
+        analyze_many = getattr(analyzer, "analyze_batch", None)
+        if analyze_many is not None:
+            raw_batch = analyze_many(texts)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                raw_batch = list(executor.map(analyzer.analyze, texts))
+        
+        return [
+            self._build_result(text, sentences, raw_results)
+            for text, sentences, raw_results in zip(texts, sentence_lists, raw_batch)
+        ]
+    
+    def _get_lx_analyzer(self) -> "lx.Analyzer":
+        """Return the langextract analyzer, creating it on first use.
         
+        The analyzer is built once per instance, under a lock so concurrent
+        first calls from several threads do not each build one.
+        """
+        if self._lx_analyzer is None:
+            with self._lx_analyzer_lock:
+                if self._lx_analyzer is None:
+                    self._lx_analyzer = lx.Analyzer(
+                        examples=self.get_examples(),
+                        description=self.get_prompt_description()
+                    )
+        return self._lx_analyzer
+    
+    def _build_result(
+        self,
+        text: str,
+        sentences: List[str],
+        raw_results: lx.data.AnnotatedDocument
+    ) -> AnalysisResult:
+        """Build the structure AnalysisResult for a text from raw extractions."""
         # Post-process results
         result = self.post_process_results(raw_results)
         
+        if self._lexicon_transitions:
+            self._merge_lexicon_transitions(result, text)
+        
         # Add structure-specific metadata
         result.add_metadata("analysis_type", "structure")
         
         # Calculate structural statistics
         paragraphs = self._split_paragraphs(text)
-        sentences = self._split_sentences(text)
         
         result.add_metadata("total_paragraphs", len(paragraphs))
         result.add_metadata("total_sentences", len(sentences))
@@ -271,60 +588,98 @@ class StructureAnalyzer(BaseAnalyzer):
                           len(sentences) / len(paragraphs) if paragraphs else 0)
         
         # Enhance structure analysis
-        self._enhance_coherence_analysis(result)
-        self._enhance_transition_analysis(result)
+        self._enhance_coherence_analysis(result, len(sentences))
+        self._enhance_transition_analysis(result, len(sentences))
         self._analyze_paragraph_patterns(result, paragraphs)
         
         return result
     
     def _split_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs."""
-        paragraphs = text.split('\n\n')
-        return [p.strip() for p in paragraphs if p.strip()]
+        return [paragraph for paragraph in (part.strip() for part in _PARA_SPLIT_RE.split(text)) if paragraph]
     
     def _split_sentences(self, text: str) -> List[str]:
-        """Simple sentence splitting."""
-        import re
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        """Simple sentence splitting.
+        
+        ASCII text is split with str.translate() and str.split(), which is
+        about 3x faster than the regex; translate() has no fast path for
+        other text, so that keeps using the regex.
+        """
+        parts = text.translate(_SENT_DELIMITERS).split('.') if text.isascii() else _SENT_RE.split(text)
+        return [s for s in (part.strip() for part in parts) if s]
     
-    def _enhance_coherence_analysis(self, result: AnalysisResult) -> None:
-        """Enhance coherence analysis with additional metrics."""
+    def _merge_lexicon_transitions(self, result: AnalysisResult, text: str) -> None:
+        """Add lexicon transition markers that the model did not report.
+        
+        A lexicon hit is a duplicate when a model marker starts at the same
+        offset, or, for model markers without offsets, has the same text.
+        """
+        markers = result.analysis_data.setdefault("transition_marker", [])
+        starts = {marker["start_index"] for marker in markers if marker.get("start_index") is not None}
+        unplaced = Counter(
+            " ".join((marker["text"] or "").lower().split())
+            for marker in markers if marker.get("start_index") is None
+        )
+        
+        for hit in _find_transition_markers(text):
+            if hit["start_index"] in starts:
+                continue
+            key = " ".join(hit["text"].lower().split())
+            if unplaced[key] > 0:
+                unplaced[key] -= 1
+                continue
+            markers.append(hit)
+        
+        if not markers:
+            del result.analysis_data["transition_marker"]
+    
+    def _enhance_coherence_analysis(self, result: AnalysisResult, sentence_count: int) -> None:
+        """Enhance coherence analysis with additional metrics.
+        
+        Args:
+            result: Result to add coherence metadata to
+            sentence_count: Number of sentences in the analyzed text (at
+                least 2, as guaranteed by validation)
+        """
         if "cohesion_device" in result.analysis_data:
             cohesion_devices = result.analysis_data["cohesion_device"]
             
             # Count types of cohesion devices
-            cohesion_counts = {}
-            for device in cohesion_devices:
-                device_type = device["attributes"].get("type", "unknown")
-                cohesion_counts[device_type] = cohesion_counts.get(device_type, 0) + 1
+            cohesion_counts = Counter(
+                attributes.get("type", "unknown")
+                for attributes in map(itemgetter("attributes"), cohesion_devices)
+            )
             
-            result.add_metadata("cohesion_device_distribution", cohesion_counts)
+            result.add_metadata("cohesion_device_distribution", dict(cohesion_counts))
             
             # Calculate coherence score based on cohesion devices
             total_devices = len(cohesion_devices)
-            sentences_count = result.metadata.get("total_sentences", 1)
-            coherence_ratio = total_devices / sentences_count if sentences_count > 0 else 0
+            coherence_ratio = total_devices / sentence_count
             
             result.add_metadata("coherence_ratio", round(coherence_ratio, 3))
     
-    def _enhance_transition_analysis(self, result: AnalysisResult) -> None:
-        """Enhance transition marker analysis."""
+    def _enhance_transition_analysis(self, result: AnalysisResult, sentence_count: int) -> None:
+        """Enhance transition marker analysis.
+        
+        Args:
+            result: Result to add transition metadata to
+            sentence_count: Number of sentences in the analyzed text (at
+                least 2, as guaranteed by validation)
+        """
         if "transition_marker" in result.analysis_data:
             transitions = result.analysis_data["transition_marker"]
             
             # Count transition types
-            transition_counts = {}
-            for transition in transitions:
-                transition_type = transition["attributes"].get("type", "unknown")
-                transition_counts[transition_type] = transition_counts.get(transition_type, 0) + 1
+            transition_counts = Counter(
+                attributes.get("type", "unknown")
+                for attributes in map(itemgetter("attributes"), transitions)
+            )
             
-            result.add_metadata("transition_type_distribution", transition_counts)
+            result.add_metadata("transition_type_distribution", dict(transition_counts))
             
             # Calculate transition density
             total_transitions = len(transitions)
-            sentences_count = result.metadata.get("total_sentences", 1)
-            transition_density = total_transitions / sentences_count if sentences_count > 0 else 0
+            transition_density = total_transitions / sentence_count
             
             result.add_metadata("transition_density", round(transition_density, 3))
             
@@ -338,39 +693,75 @@ class StructureAnalyzer(BaseAnalyzer):
             structures = result.analysis_data["paragraph_structure"]
             
             # Count paragraph patterns
-            pattern_counts = {}
-            for structure in structures:
-                pattern = structure["attributes"].get("pattern", "unknown")
-                pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
+            pattern_counts = Counter(
+                attributes.get("pattern", "unknown")
+                for attributes in map(itemgetter("attributes"), structures)
+            )
             
-            result.add_metadata("paragraph_pattern_distribution", pattern_counts)
+            result.add_metadata("paragraph_pattern_distribution", dict(pattern_counts))
             
             # Calculate average paragraph length
             if paragraphs:
-                avg_paragraph_length = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
+                # Tokenize each paragraph once for both the mean and the variation
+                lengths = [len(p.split()) for p in paragraphs]
+                count = len(lengths)
+                total = sum(lengths)
+                avg_paragraph_length = total / count
                 result.add_metadata("average_paragraph_length", round(avg_paragraph_length, 1))
                 
-                # Analyze paragraph length variation
-                lengths = [len(p.split()) for p in paragraphs]
-                if len(lengths) > 1:
-                    import statistics
-                    length_std = statistics.stdev(lengths)
+                # Analyze paragraph length variation (sample standard deviation
+                # from exact integer sums, without statistics' Fraction arithmetic)
+                if count > 1:
+                    squares = sum(length * length for length in lengths)
+                    length_std = math.sqrt((count * squares - total * total) / (count * (count - 1)))
                     result.add_metadata("paragraph_length_variation", round(length_std, 1))
     
     def validate_text(self, text: str) -> bool:
         """Validate if text is suitable for structure analysis."""
+        return self._validate_and_split(text)[0]
+    
+    def _validate_and_split(self, text: str) -> Tuple[bool, List[str]]:
+        """Validate text and return its sentences, splitting it only once.
+        
+        Args:
+            text: Text to validate
+            
+        Returns:
+            Tuple of (whether the text can be analyzed, its sentences)
+        """
         if not super().validate_text(text):
-            return False
+            return False, []
         
         # Structure analysis needs at least 2 sentences
         sentences = self._split_sentences(text)
-        return len(sentences) >= 2
+        return len(sentences) >= 2, sentences
     
     def get_configuration_schema(self) -> Dict[str, Any]:
-        """Return configuration schema for structure analyzer."""
+        """Return configuration schema for structure analyzer.
+        
+        The schema is built once per process; each call returns a copy so
+        callers may modify it freely.
+        """
+        if StructureAnalyzer._shared_configuration_schema is None:
+            StructureAnalyzer._shared_configuration_schema = self._build_configuration_schema()
+        schema = {
+            key: dict(spec)
+            for key, spec in StructureAnalyzer._shared_configuration_schema.items()
+        }
+        # The only mutable default; copy it too
+        schema["extraction_classes"]["default"] = list(EXTRACTION_CLASSES)
+        return schema
+    
+    def _build_configuration_schema(self) -> Dict[str, Any]:
+        """Build the configuration schema for structure analyzer."""
         base_schema = super().get_configuration_schema()
         
         structure_schema = {
+            "extraction_classes": {
+                "type": "array",
+                "default": list(EXTRACTION_CLASSES),
+                "description": "Extraction classes requested from the model; omit unused ones to shorten prompts and output"
+            },
             "analyze_topic_sentences": {
                 "type": "boolean",
                 "default": True,
@@ -396,6 +787,11 @@ class StructureAnalyzer(BaseAnalyzer):
                 "default": True,
                 "description": "Analyze larger rhetorical structures"
             },
+            "lexicon_transitions": {
+                "type": "boolean",
+                "default": False,
+                "description": "Also detect unambiguous transition markers with a local lexicon scan"
+            },
             "coherence_threshold": {
                 "type": "number",
                 "default": 0.3,
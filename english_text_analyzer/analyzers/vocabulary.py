@@ -1,9 +1,75 @@
 """Vocabulary analyzer for English text analysis."""
 
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, ClassVar, Optional, Tuple
+import re
+import threading
 import langextract as lx
 
 from ..core.base_analyzer import BaseAnalyzer, AnalysisResult
+from ..core.result_cache import MemoryResultCache
+
+
+# A word is a run of non-whitespace, as str.split() sees it
+_WORD_RE = re.compile(r'\S+')
+# Vocabulary analysis needs at least this many words
+_MIN_WORDS = 5
+
+# Attributes every collocation and idiom extraction receives
+_COLLOCATION_ATTRIBUTES = {
+    # Placeholder - would use corpus data in real implementation
+    "strength": "medium"
+}
+_IDIOM_ATTRIBUTES = {
+    "figurative_meaning": True,
+    "literal_translation_warning": "이 표현은 직역하면 안 됩니다"
+}
+# Usage examples for curated collocations, in priority order: when a
+# collocation contains several phrases, the earliest entry wins
+_COLLOCATION_USAGE_EXAMPLES = {
+    "take advantage of": (
+        "Take advantage of this opportunity",
+        "Students should take advantage of the resources"
+    ),
+    "mixed-methods approach": (
+        "The study used a mixed-methods approach",
+        "A mixed-methods approach combines qualitative and quantitative data"
+    ),
+}
+_COLLOCATION_PRIORITY = {
+    phrase: index for index, phrase in enumerate(_COLLOCATION_USAGE_EXAMPLES)
+}
+# One alternation finds every curated phrase in a single scan, however
+# long the table grows
+_COLLOCATION_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in _COLLOCATION_USAGE_EXAMPLES)
+)
+
+
+def _enhance_collocation(collocation: Dict[str, Any]) -> None:
+    """Add strength and curated usage examples to a collocation extraction."""
+    collocation["attributes"].update(_COLLOCATION_ATTRIBUTES)
+    
+    # Add usage examples
+    phrases = _COLLOCATION_RE.findall(collocation["text"])
+    if phrases:
+        phrase = min(phrases, key=_COLLOCATION_PRIORITY.__getitem__)
+        collocation["attributes"]["usage_examples"] = list(
+            _COLLOCATION_USAGE_EXAMPLES[phrase]
+        )
+
+
+def _enhance_idiom(idiom: Dict[str, Any]) -> None:
+    """Mark an idiom extraction as figurative."""
+    idiom["attributes"].update(_IDIOM_ATTRIBUTES)
+
+
+# Per-extraction enhancement for each extraction class; classes without
+# an entry are left as extracted
+_EXTRACTION_ENHANCERS = {
+    "collocation": _enhance_collocation,
+    "idiomatic_expression": _enhance_idiom,
+}
 
 
 class VocabularyAnalyzer(BaseAnalyzer):
@@ -14,11 +80,36 @@ class VocabularyAnalyzer(BaseAnalyzer):
     collocations, and idiomatic expressions.
     """
     
-    def __init__(self):
+    # Examples and prompt are static, so they are built once per process
+    _shared_examples: ClassVar[Optional[List[lx.data.ExampleData]]] = None
+    _shared_prompt_description: ClassVar[Optional[str]] = None
+    
+    def __init__(self, cache_size: int = 128):
+        """Initialize the vocabulary analyzer.
+        
+        Args:
+            cache_size: Maximum number of memoized analyses kept in memory
+        """
         super().__init__("vocabulary")
+        # Memoize full analyses per instance; batch comparisons re-analyze
+        # the same reference passages
+        self._memory_cache = MemoryResultCache(cache_size)
+        self._lx_analyzer = None
+        self._lx_analyzer_lock = threading.Lock()
     
     def get_examples(self) -> List[lx.data.ExampleData]:
-        """Return example data for vocabulary analysis."""
+        """Return example data for vocabulary analysis.
+        
+        The examples are built once per process and shared by all instances.
+        """
+        if self._examples is None:
+            if VocabularyAnalyzer._shared_examples is None:
+                VocabularyAnalyzer._shared_examples = self._build_examples()
+            self._examples = VocabularyAnalyzer._shared_examples
+        return self._examples
+    
+    def _build_examples(self) -> List[lx.data.ExampleData]:
+        """Build the langextract example data for vocabulary analysis."""
         return [
             lx.data.ExampleData(
                 text="The comprehensive analysis revealed significant discrepancies in the data.",
@@ -216,6 +307,14 @@ class VocabularyAnalyzer(BaseAnalyzer):
     
     def get_prompt_description(self) -> str:
         """Return the prompt description for vocabulary analysis."""
+        if self._prompt_description is None:
+            if VocabularyAnalyzer._shared_prompt_description is None:
+                VocabularyAnalyzer._shared_prompt_description = self._build_prompt_description()
+            self._prompt_description = VocabularyAnalyzer._shared_prompt_description
+        return self._prompt_description
+    
+    def _build_prompt_description(self) -> str:
+        """Build the prompt description for vocabulary analysis."""
         return """
         Analyze the vocabulary in the given English text and extract the following information:
 
@@ -253,89 +352,112 @@ class VocabularyAnalyzer(BaseAnalyzer):
         """
     
     def analyze(self, text: str) -> AnalysisResult:
-        """Perform vocabulary analysis on the given text."""
-        if not self.validate_text(text):
-            raise ValueError("Text is not suitable for vocabulary analysis")
+        """Perform vocabulary analysis on the given text.
         
-        # Use langextract to perform the analysis
-        examples = self.get_examples()
-        prompt_description = self.get_prompt_description()
+        Results are memoized by text, so re-analyzing an identical passage
+        returns a copy of the cached AnalysisResult without another model
+        call. Callers may modify the returned result freely.
         
-        # Create langextract analyzer
-        analyzer = lx.Analyzer(
-            examples=examples,
-            description=prompt_description
-        )
+        Args:
+            text: The text to analyze
+            
+        Returns:
+            AnalysisResult containing vocabulary analysis
+        """
+        result = self._memory_cache.get(text)
+        if result is None:
+            result = self._memory_cache.put(text, self._analyze_uncached(text))
+        return result
+    
+    def clear_cache(self) -> None:
+        """Clear memoized analysis results."""
+        self._memory_cache.clear()
+    
+    def _analyze_uncached(self, text: str) -> AnalysisResult:
+        """Run vocabulary analysis without consulting the in-memory cache."""
+        is_valid, words = self._validate_and_split(text)
+        if not is_valid:
+            raise ValueError("Text is not suitable for vocabulary analysis")
         
-        # Perform analysis
-        raw_results = analyzer.analyze(text)
+        # Perform analysis with the shared langextract analyzer
+        raw_results = self._get_lx_analyzer().analyze(text)
         
         # Post-process results
         result = self.post_process_results(raw_results)
         
-        # Add vocabulary-specific metadata
+        # Add vocabulary-specific metadata; the words are split only once
+        word_count = len(words)
+        unique_words = set(map(str.lower, words))
         result.add_metadata("analysis_type", "vocabulary")
-        result.add_metadata("total_words", len(text.split()))
-        result.add_metadata("unique_words", len(set(text.lower().split())))
+        result.add_metadata("total_words", word_count)
+        result.add_metadata("unique_words", len(unique_words))
         
         # Calculate vocabulary diversity
-        words = text.split()
-        unique_words = set(word.lower() for word in words)
-        if len(words) > 0:
-            lexical_diversity = len(unique_words) / len(words)
+        if word_count > 0:
+            lexical_diversity = len(unique_words) / word_count
             result.add_metadata("lexical_diversity", round(lexical_diversity, 3))
         
         # Add collocation and idiom-specific processing
-        self._enhance_collocation_detection(result)
-        self._enhance_idiom_detection(result)
+        self._enhance_extractions(result)
         
         return result
     
-    def _enhance_collocation_detection(self, result: AnalysisResult) -> None:
-        """Enhance collocation detection with additional patterns."""
-        if "collocation" in result.analysis_data:
-            collocations = result.analysis_data["collocation"]
-            
-            # Add collocation strength and frequency metadata
-            for collocation in collocations:
-                # Add collocation strength (placeholder - would use corpus data in real implementation)
-                collocation["attributes"]["strength"] = "medium"
-                
-                # Add usage examples
-                if "take advantage of" in collocation["text"]:
-                    collocation["attributes"]["usage_examples"] = [
-                        "Take advantage of this opportunity",
-                        "Students should take advantage of the resources"
-                    ]
-                elif "mixed-methods approach" in collocation["text"]:
-                    collocation["attributes"]["usage_examples"] = [
-                        "The study used a mixed-methods approach",
-                        "A mixed-methods approach combines qualitative and quantitative data"
-                    ]
+    def _get_lx_analyzer(self) -> "lx.Analyzer":
+        """Return the langextract analyzer, creating it on first use.
+        
+        The analyzer is built once per instance, under a lock so concurrent
+        first calls from several threads do not each build one.
+        """
+        if self._lx_analyzer is None:
+            with self._lx_analyzer_lock:
+                if self._lx_analyzer is None:
+                    self._lx_analyzer = lx.Analyzer(
+                        examples=self.get_examples(),
+                        description=self.get_prompt_description()
+                    )
+        return self._lx_analyzer
     
-    def _enhance_idiom_detection(self, result: AnalysisResult) -> None:
-        """Enhance idiom detection with additional patterns."""
-        # Add idiom detection if not already present
+    def _enhance_extractions(self, result: AnalysisResult) -> None:
+        """Enhance every extraction in one pass over the analysis data.
+        
+        Each extraction class is dispatched to its enhancer from
+        _EXTRACTION_ENHANCERS, so adding a class does not add another pass.
+        """
+        # Idioms are always reported, even when none were found
         if "idiomatic_expression" not in result.analysis_data:
             result.analysis_data["idiomatic_expression"] = []
         
-        # Look for common idiomatic patterns in the text
-        # This is a simplified implementation - real implementation would use comprehensive idiom database
-        idioms = result.analysis_data["idiomatic_expression"]
-        
-        # Add metadata for existing idioms
-        for idiom in idioms:
-            idiom["attributes"]["figurative_meaning"] = True
-            idiom["attributes"]["literal_translation_warning"] = "이 표현은 직역하면 안 됩니다"
+        for extraction_class, extractions in result.analysis_data.items():
+            enhance = _EXTRACTION_ENHANCERS.get(extraction_class)
+            if enhance is None:
+                continue
+            for extraction in extractions:
+                enhance(extraction)
     
     def validate_text(self, text: str) -> bool:
-        """Validate if text is suitable for vocabulary analysis."""
+        """Validate if text is suitable for vocabulary analysis.
+        
+        Only the first few words are scanned; the text is not split.
+        """
         if not super().validate_text(text):
             return False
         
-        # Vocabulary analysis needs at least 5 words
+        return sum(1 for _ in islice(_WORD_RE.finditer(text), _MIN_WORDS)) >= _MIN_WORDS
+    
+    def _validate_and_split(self, text: str) -> Tuple[bool, List[str]]:
+        """Validate text and return its words, splitting it only once.
+        
+        Args:
+            text: Text to validate
+            
+        Returns:
+            Tuple of (whether the text can be analyzed, its words)
+        """
+        if not super().validate_text(text):
+            return False, []
+        
         words = text.split()
-        return len(words) >= 5
+        return len(words) >= _MIN_WORDS, words
     
     def get_configuration_schema(self) -> Dict[str, Any]:
         """Return configuration schema for vocabulary analyzer."""
@@ -371,6 +493,11 @@ class VocabularyAnalyzer(BaseAnalyzer):
                 "type": "array",
                 "default": ["A1", "A2", "B1", "B2", "C1", "C2"],
                 "description": "CEFR levels to include in analysis"
+            },
+            "cache_size": {
+                "type": "integer",
+                "default": 128,
+                "description": "Maximum number of memoized analyses per analyzer"
             }
         }
         
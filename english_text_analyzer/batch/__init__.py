@@ -1,6 +1,23 @@
 """Batch processing modules for English text analysis."""
 
-from .processor import BatchProcessor
-from .comparator import BatchComparator
+from importlib import import_module
+from typing import Any
 
-__all__ = ['BatchProcessor', 'BatchComparator']
\ No newline at end of file
+# Batch classes are imported on first access, so importing the package
+# does not import both modules (and their dependencies)
+_BATCH_MODULES = {
+    'BatchProcessor': '.processor',
+    'BatchComparator': '.comparator'
+}
+
+__all__ = ['BatchProcessor', 'BatchComparator']
+
+
+def __getattr__(name: str) -> Any:
+    """Import a batch class from its module on first access."""
+    module_name = _BATCH_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,7 +2,6 @@
 
 import logging
 from typing import List, Optional, Dict, Any
-import langextract as lx
 
 from .orchestrator import AnalysisOrchestrator
 from ..models.results import AnalysisResults
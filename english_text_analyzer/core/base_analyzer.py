@@ -1,13 +1,28 @@
 """Base analyzer abstract class for all analysis modules."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-import langextract as lx
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import langextract as lx
 
 
 class AnalysisResult:
     """Base class for analysis results from individual analyzers."""
     
+    # results, confidence_score and processing_time are optional and only set
+    # by some analyzers; AnalysisResults checks for them with hasattr()
+    __slots__ = (
+        "analyzer_name",
+        "analysis_data",
+        "metadata",
+        "results",
+        "confidence_score",
+        "processing_time",
+    )
+    
     def __init__(self, analyzer_name: str, analysis_data: Dict[str, Any]):
         self.analyzer_name = analyzer_name
         self.analysis_data = analysis_data
@@ -26,6 +41,40 @@ class AnalysisResult:
         }
 
 
+def select_extraction_classes(
+    requested: Optional[Iterable[str]], available: Tuple[str, ...], analyzer_name: str
+) -> Tuple[str, ...]:
+    """Validate an analyzer's extraction_classes option.
+    
+    Args:
+        requested: Extraction classes asked for, in any order; all
+            available classes when None
+        available: The analyzer's extraction classes, in prompt order
+        analyzer_name: Analyzer name used in error messages
+        
+    Returns:
+        The requested classes in prompt order
+        
+    Raises:
+        ValueError: If a class is unknown, none is requested, or a bare
+            string is passed instead of a collection of names
+    """
+    if requested is None:
+        return available
+    if isinstance(requested, str):
+        raise ValueError(
+            f"{analyzer_name} extraction classes must be a collection of names, not a string"
+        )
+    
+    # Materialize once so generators and other one-shot iterables work
+    requested = set(requested)
+    unknown = requested.difference(available)
+    selected = tuple(name for name in available if name in requested)
+    if unknown or not selected:
+        raise ValueError(f"Unknown or empty {analyzer_name} extraction classes: {sorted(unknown)}")
+    return selected
+
+
 class BaseAnalyzer(ABC):
     """Abstract base class for all text analyzers.
     
@@ -0,0 +1,131 @@
+"""In-memory and persistent on-disk caches of analysis results."""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+import copy
+import hashlib
+import os
+import pickle
+import threading
+
+from .base_analyzer import AnalysisResult
+
+
+class MemoryResultCache:
+    """Bounded least-recently-used cache of analysis results keyed by text.
+    
+    Cached results are never handed out directly: put() stores a copy and
+    get() returns a copy, so callers may modify the AnalysisResult they
+    receive (add_metadata, analysis_data edits) without affecting later
+    hits for the same text.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of results kept; nothing is cached
+                when 0
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, AnalysisResult]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, text: str) -> Optional[AnalysisResult]:
+        """Return a copy of the cached result for a text, or None on a miss."""
+        with self._lock:
+            result = self._entries.get(text)
+            if result is None:
+                return None
+            self._entries.move_to_end(text)
+        # Entries are never modified in place, so copying outside the lock is safe
+        return copy.deepcopy(result)
+    
+    def put(self, text: str, result: AnalysisResult) -> AnalysisResult:
+        """Cache a copy of a result, evicting the oldest entry if full, and return it."""
+        if self.maxsize <= 0:
+            return result
+        
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._entries[text] = stored
+            self._entries.move_to_end(text)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+    
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResultCache:
+    """Pickled AnalysisResult cache keyed by analyzer, prompt and text.
+    
+    Each entry is one file named after a digest of the prompt and the text,
+    so results produced under a different prompt (e.g. another extraction
+    class selection) are never reused. The namespace keeps analyzers that
+    share a directory apart, and the version is bumped by an analyzer when
+    its pickled result layout changes so stale entries are ignored.
+    
+    The cache is an optimization: read and write failures are treated as
+    misses, and when directory is None every lookup misses and nothing is
+    written.
+    """
+    
+    def __init__(self, directory: Optional[Union[str, Path]], namespace: str, version: int):
+        """Initialize the cache.
+        
+        Args:
+            directory: Directory holding the cache files; caching is
+                disabled when None
+            namespace: Analyzer-specific file name prefix, e.g. "grammar"
+            version: Result layout version included in every file name
+        """
+        self.directory = Path(directory).expanduser() if directory is not None else None
+        self.namespace = namespace
+        self.version = version
+    
+    def path(self, prompt: str, text: str) -> Path:
+        """Return the cache file for a text analyzed with a prompt."""
+        digest = hashlib.blake2b(prompt.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return self.directory / f"{self.namespace}-{digest.hexdigest()}-v{self.version}.pkl"
+    
+    def load(self, prompt: str, text: str) -> Optional[AnalysisResult]:
+        """Return the cached result for a text, or None on a miss."""
+        if self.directory is None:
+            return None
+        
+        try:
+            with open(self.path(prompt, text), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            # Unreadable or stale entry; analyze again and overwrite it
+            return None
+    
+    def store(self, prompt: str, text: str, result: AnalysisResult) -> AnalysisResult:
+        """Write a result to the cache (if enabled) and return it."""
+        if self.directory is None:
+            return result
+        
+        path = self.path(prompt, text)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is an optimization; analysis results are still returned
+            pass
+        return result
@@ -0,0 +1,26 @@
+"""Compact record base class for per-analysis intermediate data."""
+
+from typing import Any, Dict
+
+
+def _plain(value: Any) -> Any:
+    """Convert records, and lists of records, to plain Python values."""
+    if isinstance(value, SlottedRecord):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class SlottedRecord:
+    """Base for slotted dataclass records, with a dict view for output.
+    
+    Subclasses declare __slots__ by hand (dataclass(slots=True) needs
+    Python 3.10) listing their fields in output order.
+    """
+    
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record (and any nested records) to a dictionary."""
+        return {name: _plain(getattr(self, name)) for name in self.__slots__}
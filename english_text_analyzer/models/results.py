@@ -5,6 +5,26 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Hand datetime, dataclass and str/int/dict/list subclass values to
+    # _reject_for_json instead of encoding them, matching the json module
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _reject_for_json(value: Any) -> Any:
+    """orjson default hook: defer values orjson passes through to the json module."""
+    raise TypeError(f"Object of type {type(value).__name__} is not handled by orjson")
+
 from ..core.base_analyzer import AnalysisResult
 
 
@@ -395,13 +415,37 @@ class AnalysisResults:
     def to_json(self, indent: int = 2) -> str:
         """Convert results to JSON string.
         
+        With indent=2 and the optional orjson package installed, orjson
+        does the encoding. Its output parses to the same values as the json
+        module's except that:
+        
+        - NaN and infinities are written as null, where json writes the
+          non-standard NaN/Infinity tokens
+        - floats in exponent form are written as e.g. 1e16 and 1e-7
+          rather than 1e+16 and 1e-07
+        - UUID and Enum values are encoded instead of raising TypeError
+        
+        datetime and dataclass values raise TypeError on both paths.
+        
         Args:
             indent: JSON indentation level
             
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        data = self.to_dict()
+        
+        if orjson is not None and indent == 2:
+            try:
+                return orjson.dumps(
+                    data, default=_reject_for_json, option=_ORJSON_OPTIONS
+                ).decode("utf-8")
+            except TypeError:
+                # e.g. non-string dict keys, or types the json module also
+                # rejects; let the json module handle them (or raise)
+                pass
+        
+        return json.dumps(data, indent=indent, ensure_ascii=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AnalysisResults':
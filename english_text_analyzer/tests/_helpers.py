@@ -0,0 +1,23 @@
+"""Shared builders for analyzer tests."""
+
+from typing import Any, List
+from unittest.mock import Mock
+
+
+def make_extraction(extraction_class: str, extraction_text: str, **attributes: Any) -> Mock:
+    """Build a langextract-like extraction without source offsets."""
+    return Mock(
+        extraction_class=extraction_class,
+        extraction_text=extraction_text,
+        attributes=attributes,
+        start_index=None,
+        end_index=None
+    )
+
+
+def mock_document(text: str, extractions: List[Mock]) -> Mock:
+    """Build a langextract-like annotated document for a text."""
+    document = Mock()
+    document.text = text
+    document.extractions = list(extractions)
+    return document
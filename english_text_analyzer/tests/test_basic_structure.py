@@ -107,5 +107,39 @@ def test_text_preprocessor():
         pytest.fail(f"Failed to test TextPreprocessor: {e}")
 
 
+
+def test_analysis_result_slots():
+    """Test that AnalysisResult is slotted and optional attributes stay unset."""
+    import pickle
+    from english_text_analyzer.core.base_analyzer import AnalysisResult
+    
+    result = AnalysisResult("grammar", {"verb_tense": []})
+    result.add_metadata("analysis_type", "grammar")
+    
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(result, "results")
+    assert pickle.loads(pickle.dumps(result)).to_dict() == result.to_dict()
+
+
+
+def test_disk_result_cache(tmp_path):
+    """Test that disk cache entries are keyed by namespace, prompt and text."""
+    from english_text_analyzer.core.base_analyzer import AnalysisResult
+    from english_text_analyzer.core.result_cache import DiskResultCache
+    
+    cache = DiskResultCache(tmp_path, "grammar", 2)
+    result = cache.store("prompt", "Some text.", AnalysisResult("grammar", {"verb_tense": []}))
+    
+    assert cache.load("prompt", "Some text.").to_dict() == result.to_dict()
+    assert cache.load("other prompt", "Some text.") is None
+    assert DiskResultCache(tmp_path, "content", 2).load("prompt", "Some text.") is None
+    assert DiskResultCache(tmp_path, "grammar", 3).load("prompt", "Some text.") is None
+    
+    # Corrupt entries are misses, and a disabled cache never hits
+    cache.path("prompt", "Some text.").write_bytes(b"not a pickle")
+    assert cache.load("prompt", "Some text.") is None
+    assert DiskResultCache(None, "grammar", 2).load("prompt", "Some text.") is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
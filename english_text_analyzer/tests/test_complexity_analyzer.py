@@ -1,10 +1,13 @@
 """Tests for ComplexityAnalyzer."""
 
+import random
+
 import pytest
 from unittest.mock import Mock, patch
 import langextract as lx
 
-from ..analyzers.complexity import ComplexityAnalyzer
+from ..analyzers import complexity
+from ..analyzers.complexity import ComplexityAnalyzer, format_complexity_report
 from ..core.base_analyzer import AnalysisResult
 
 
@@ -33,6 +36,33 @@ class TestComplexityAnalyzer:
             assert example.text
             assert len(example.extractions) > 0
     
+    def test_get_examples_cached(self):
+        """Test that examples and prompt are built once per analyzer."""
+        assert self.analyzer.get_examples() is self.analyzer.get_examples()
+        assert self.analyzer.get_prompt_description() is self.analyzer.get_prompt_description()
+    
+    def test_examples_shared_across_instances(self):
+        """Test that examples are built once per process."""
+        other = ComplexityAnalyzer()
+        assert other.get_examples() is self.analyzer.get_examples()
+    
+    def test_get_shared(self):
+        """Test the process-wide shared analyzer instance."""
+        assert ComplexityAnalyzer.get_shared() is ComplexityAnalyzer.get_shared()
+        assert ComplexityAnalyzer.get_shared(cache_size=4) is not ComplexityAnalyzer.get_shared()
+    
+    def test_get_shared_per_subclass(self):
+        """Test that subclasses and the base class keep separate shared instances."""
+        class CustomAnalyzer(ComplexityAnalyzer):
+            pass
+        
+        custom = CustomAnalyzer.get_shared(cache_size=7)
+        base = ComplexityAnalyzer.get_shared(cache_size=7)
+        
+        assert type(custom) is CustomAnalyzer
+        assert type(base) is ComplexityAnalyzer
+        assert CustomAnalyzer.get_shared(cache_size=7) is custom
+    
     def test_get_prompt_description(self):
         """Test prompt description."""
         prompt = self.analyzer.get_prompt_description()
@@ -75,6 +105,41 @@ class TestComplexityAnalyzer:
         complex_level = self.analyzer.estimate_cefr_level(self.complex_text)
         assert complex_level in ["C1", "C2"]
     
+    def test_estimate_cefr_level_fast(self):
+        """Test fast CEFR estimation agrees with the full estimate."""
+        for text in [self.simple_text, self.complex_text, ""]:
+            assert (self.analyzer.estimate_cefr_level_fast(text) ==
+                    self.analyzer.estimate_cefr_level(text))
+    
+    def test_estimate_cefr_level_fast_random_parity(self):
+        """Test fast CEFR estimation only disagrees when off by more than the margin."""
+        vocabulary = (
+            "the cat sat on mat it was warm and sunny students learn language "
+            "through reading every day beautiful education university strength "
+            "rhythm queue area idea paradigmatic contemporary linguistic theory "
+            "necessitates comprehensive reevaluation traditional syntactic"
+        ).split()
+        rng = random.Random(1234)
+        disagreements = 0
+        trials = 500
+        
+        for _ in range(trials):
+            text = " ".join(
+                " ".join(rng.choice(vocabulary) for _ in range(rng.randint(3, 30))).capitalize() + "."
+                for _ in range(rng.randint(1, 6))
+            )
+            fast_level = self.analyzer.estimate_cefr_level_fast(text)
+            if fast_level == self.analyzer.estimate_cefr_level(text):
+                continue
+            
+            disagreements += 1
+            words, sentences = complexity._tokenize_text(text)
+            exact_grade = self.analyzer._readability_scores(text).flesch_kincaid_grade
+            approx_grade = complexity._approximate_grade(words, sentences)
+            assert abs(approx_grade - exact_grade) > complexity._CEFR_FAST_MARGIN
+        
+        assert disagreements / trials < 0.05
+    
     def test_analyze_lexical_diversity(self):
         """Test lexical diversity analysis."""
         diversity = self.analyzer.analyze_lexical_diversity(self.simple_text)
@@ -107,6 +172,15 @@ class TestComplexityAnalyzer:
         assert 0 <= complexity["complex_sentence_ratio"] <= 1.0
         assert 0 <= complexity["syntactic_complexity_score"] <= 10.0
     
+    def test_clause_hits_match_re_fallback(self):
+        """Test that the accelerated clause scan agrees with the re fallback."""
+        text = "And so, android OR sand: who knew? The cat that sat, which ran, WHERE when."
+        expected = [match.start() for match in complexity._CLAUSE_RE.finditer(text)]
+        
+        assert list(complexity._clause_hit_positions(text)) == expected
+        with patch.object(complexity, "_CLAUSE_DATABASE", None):
+            assert list(complexity._clause_hit_positions(text)) == expected
+    
     def test_calculate_information_density(self):
         """Test information density calculation."""
         density = self.analyzer.calculate_information_density(self.simple_text)
@@ -134,6 +208,41 @@ class TestComplexityAnalyzer:
             assert isinstance(rec, str)
             assert len(rec) > 0
     
+    def test_format_complexity_report(self):
+        """Test that metrics are rounded only when the report is formatted."""
+        raw = {
+            "readability_scores": {"flesch_kincaid_grade": 2.34567, "flesch_reading_ease": 91.2345},
+            "lexical_diversity": {"ttr": 0.123456},
+            "cefr_level": "A1",
+            "recommendations": ["a"]
+        }
+        
+        formatted = format_complexity_report(raw)
+        
+        assert formatted["readability_scores"] == {"flesch_kincaid_grade": 2.3, "flesch_reading_ease": 91.2}
+        assert formatted["lexical_diversity"] == {"ttr": 0.123}
+        assert formatted["cefr_level"] == "A1"
+        assert formatted["recommendations"] == ["a"]
+        assert raw["lexical_diversity"]["ttr"] == 0.123456
+    
+    def test_public_metrics_are_rounded(self):
+        """Test that the public metric methods round like the report does."""
+        analyzer = self.analyzer
+        text = self.complex_text
+        tokens = analyzer._tokenize(text)
+        
+        assert analyzer.calculate_readability_scores(text) == format_complexity_report(
+            {"r": analyzer._readability_scores(text, tokens).to_dict()})["r"]
+        assert analyzer.analyze_lexical_diversity(text) == format_complexity_report(
+            {"r": analyzer._lexical_diversity(tokens[0]).to_dict()})["r"]
+        assert analyzer.analyze_syntactic_complexity(text) == format_complexity_report(
+            {"r": analyzer._syntactic_complexity(text, analyzer._sentence_spans(text)).to_dict()})["r"]
+        assert analyzer.calculate_information_density(text) == format_complexity_report(
+            {"r": analyzer._information_density(tokens).to_dict()})["r"]
+        
+        grade = analyzer.calculate_readability_scores(text)["flesch_kincaid_grade"]
+        assert grade == round(grade, 1)
+    
     def test_count_sentences(self):
         """Test sentence counting."""
         text = "First sentence. Second sentence! Third sentence?"
@@ -143,6 +252,16 @@ class TestComplexityAnalyzer:
         # Test with no sentences
         count = self.analyzer._count_sentences("no punctuation")
         assert count == 1  # Should return at least 1
+        
+        # Precomputed counts skip the scan
+        assert self.analyzer._count_sentences(text, sentence_count=5) == 5
+        assert self.analyzer._count_sentences(text, sentence_count=0) == 1
+    
+    def test_split_sentences(self):
+        """Test sentence splitting shared by the syntactic metrics."""
+        text = "First sentence.  Second one!? ... Third"
+        assert self.analyzer._split_sentences(text) == ["First sentence", "Second one", "Third"]
+        assert self.analyzer._split_sentences("") == []
     
     def test_count_words(self):
         """Test word counting."""
@@ -154,6 +273,17 @@ class TestComplexityAnalyzer:
         count = self.analyzer._count_words("")
         assert count == 0
     
+    def test_tokenize(self):
+        """Test single-pass tokenization."""
+        words, sentence_count = self.analyzer._tokenize("Hello World! This is a test.")
+        assert words == ("hello", "world", "this", "is", "a", "test")
+        assert sentence_count == 2
+        
+        # Tokens passed in should give the same scores as rescanning the text
+        tokens = self.analyzer._tokenize(self.simple_text)
+        assert (self.analyzer.calculate_readability_scores(self.simple_text, tokens) ==
+                self.analyzer.calculate_readability_scores(self.simple_text))
+    
     def test_count_syllables(self):
         """Test syllable counting."""
         # Test known syllable counts
@@ -162,6 +292,15 @@ class TestComplexityAnalyzer:
         assert self.analyzer._count_syllables_in_word("beautiful") == 3
         assert self.analyzer._count_syllables_in_word("education") == 4
     
+    def test_count_syllables_text_matches_per_word(self):
+        """Test vectorized text syllable count against the per-word heuristic."""
+        for text in [self.simple_text, self.complex_text, "", "123 !!", "Café AREA queue, the e."]:
+            expected = sum(
+                self.analyzer._count_syllables_in_word(word)
+                for word in self.analyzer._tokenize(text)[0]
+            )
+            assert self.analyzer._count_syllables(text) == expected
+    
     def test_post_process_results(self):
         """Test post-processing of results."""
         # Create mock annotated document
@@ -178,6 +317,22 @@ class TestComplexityAnalyzer:
         assert "cefr_level" in result.results
         assert "recommendations" in result.results
     
+    def test_post_process_records_llm_assessment(self):
+        """Test that a langextract readability assessment is kept as metadata."""
+        mock_doc = Mock()
+        mock_doc.text = self.simple_text
+        mock_doc.extractions = [
+            lx.data.Extraction(
+                extraction_class="readability_assessment",
+                extraction_text=self.simple_text,
+                attributes={"cefr_level": "A1"}
+            )
+        ]
+        
+        result = self.analyzer.post_process_results(mock_doc)
+        
+        assert result.metadata["llm_assessment"] == {"cefr_level": "A1"}
+    
     @patch('langextract.extract')
     def test_analyze_integration(self, mock_extract):
         """Test full analysis integration."""
@@ -192,6 +347,59 @@ class TestComplexityAnalyzer:
         assert isinstance(result, AnalysisResult)
         assert result.analyzer_name == "complexity"
         mock_extract.assert_called_once()
+    
+    @patch('langextract.extract')
+    def test_analyze_is_memoized(self, mock_extract):
+        """Test that repeated analysis of the same text hits the cache."""
+        mock_doc = Mock()
+        mock_doc.text = self.simple_text
+        mock_doc.extractions = []
+        mock_extract.return_value = mock_doc
+        
+        first = self.analyzer.analyze(self.simple_text)
+        second = self.analyzer.analyze(self.simple_text)
+        
+        assert second.to_dict() == first.to_dict()
+        mock_extract.assert_called_once()
+        
+        self.analyzer.clear_cache()
+        self.analyzer.analyze(self.simple_text)
+        assert mock_extract.call_count == 2
+
+    
+    @patch('langextract.extract')
+    def test_cached_results_are_copies(self, mock_extract):
+        """Test that modifying a returned result does not affect later cache hits."""
+        mock_doc = Mock()
+        mock_doc.text = self.simple_text
+        mock_doc.extractions = []
+        mock_extract.return_value = mock_doc
+        
+        first = self.analyzer.analyze(self.simple_text)
+        first.add_metadata("note", 1)
+        first.results["cefr_level"] = "C2"
+        second = self.analyzer.analyze(self.simple_text)
+        
+        assert second is not first
+        assert "note" not in second.metadata
+        assert second.results["cefr_level"] != "C2"
+        mock_extract.assert_called_once()
+    
+    def test_compute_metrics_record(self):
+        """Test that the metrics record converts to the report layout."""
+        metrics = self.analyzer._compute_metrics(self.complex_text)
+        
+        assert isinstance(metrics, complexity.ComplexityMetrics)
+        assert not hasattr(metrics, "__dict__")
+        
+        data = metrics.to_dict()
+        assert list(data) == [
+            "readability_scores", "cefr_level", "lexical_diversity", "sentence_metrics",
+            "syntactic_complexity", "information_density", "recommendations"
+        ]
+        report = format_complexity_report(data)
+        assert report["lexical_diversity"] == self.analyzer.analyze_lexical_diversity(self.complex_text)
+        assert report == self.analyzer._build_complexity_data(self.complex_text)
 
 
 if __name__ == "__main__":
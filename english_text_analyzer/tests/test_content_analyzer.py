@@ -0,0 +1,242 @@
+"""Tests for ContentAnalyzer."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from unittest.mock import Mock, patch
+import langextract as lx
+
+from ..analyzers.content import EXTRACTION_CLASSES, ContentAnalyzer, ContentHierarchy, IdeaEntry
+from ._helpers import make_extraction, mock_document
+
+
+class TestContentAnalyzer:
+    """Test cases for ContentAnalyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = ContentAnalyzer()
+        self.text = (
+            "Education is the foundation of personal and societal development. "
+            "It provides individuals with knowledge and skills necessary for success. "
+            "For example, students who receive quality education often become leaders."
+        )
+    
+    def _mock_document(self, text):
+        """Build a langextract-like document with one extraction per class."""
+        return mock_document(text, [
+            make_extraction("main_idea", "Education is the foundation", type="thesis_statement", position="opening"),
+            make_extraction("evidence", "students who receive quality education", evidence_type="example", strength="strong"),
+            make_extraction("argument_structure", "Education is the foundation", component="main_claim", argument_type="assertion"),
+        ])
+    
+    def test_get_examples(self):
+        """Test example data generation."""
+        examples = self.analyzer.get_examples()
+        
+        assert len(examples) == 4
+        for example in examples:
+            assert isinstance(example, lx.data.ExampleData)
+            assert len(example.extractions) > 0
+    
+    def test_examples_shared_across_instances(self):
+        """Test that examples and prompt are built once per process."""
+        other = ContentAnalyzer()
+        assert other.get_examples() is self.analyzer.get_examples()
+        assert other.get_prompt_description() is self.analyzer.get_prompt_description()
+
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_batch_reuses_analyzer(self, mock_analyzer_cls):
+        """Test that batch analysis sets up langextract once."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        
+        results = list(self.analyzer.analyze_batch([self.text] * 3, batch_size=2))
+        
+        assert len(results) == 3
+        mock_analyzer_cls.assert_called_once()
+        assert lx_analyzer.analyze.call_count == 3
+        assert results[0].metadata == self.analyzer.analyze(self.text).metadata
+        mock_analyzer_cls.assert_called_once()
+    
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers only inherit the patched langextract when forked"
+    )
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_parallel(self, mock_analyzer_cls):
+        """Test that parallel analysis matches sequential analysis."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        
+        results = list(self.analyzer.analyze_parallel(iter([self.text] * 3), n_jobs=2, chunksize=1))
+        
+        assert len(results) == 3
+        assert all(result.metadata == self.analyzer.analyze(self.text).metadata for result in results)
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_reuses_analyzer(self, mock_analyzer_cls):
+        """Test that repeated analyze() calls share one langextract analyzer."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(self.analyzer.analyze, [self.text] * 8))
+        
+        mock_analyzer_cls.assert_called_once_with(
+            examples=self.analyzer.get_examples(),
+            description=self.analyzer.get_prompt_description()
+        )
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_disk_cache(self, mock_analyzer_cls, tmp_path):
+        """Test that cached results are reused across analyzer instances."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        
+        first = ContentAnalyzer(cache_dir=tmp_path).analyze(self.text)
+        second = ContentAnalyzer(cache_dir=tmp_path).analyze(self.text)
+        batch = list(ContentAnalyzer(cache_dir=tmp_path).analyze_batch([self.text]))
+        
+        assert lx_analyzer.analyze.call_count == 1
+        assert second.to_dict() == first.to_dict()
+        assert batch[0].to_dict() == first.to_dict()
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_disk_cache_keyed_by_extraction_classes(self, mock_analyzer_cls, tmp_path):
+        """Test that different extraction class selections keep separate cache entries."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        
+        ContentAnalyzer(cache_dir=tmp_path, extraction_classes=["main_idea"]).analyze(self.text)
+        ContentAnalyzer(cache_dir=tmp_path, extraction_classes=["evidence"]).analyze(self.text)
+        ContentAnalyzer(cache_dir=tmp_path, extraction_classes=["main_idea"]).analyze(self.text)
+        
+        assert lx_analyzer.analyze.call_count == 2
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_content_metadata(self, mock_analyzer_cls):
+        """Test distributions, scores and hierarchy built from extractions."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        result = self.analyzer.analyze(self.text)
+        metadata = result.metadata
+        
+        assert metadata["total_sentences"] == 3
+        assert metadata["main_idea_distribution"] == {"thesis_statement": 1}
+        assert metadata["main_idea_positions"] == {"opening": 1}
+        assert metadata["main_idea_density"] == 0.333
+        assert metadata["evidence_strength_distribution"] == {"strong": 1}
+        assert metadata["average_evidence_quality"] == 3
+        assert metadata["argument_type_distribution"] == {"assertion": 1}
+        assert metadata["argument_complexity_score"] == 1
+        
+        hierarchy = metadata["content_hierarchy"]
+        assert hierarchy["primary_ideas"] == [
+            {"text": "Education is the foundation", "type": "thesis_statement", "position": "opening"}
+        ]
+        assert hierarchy["supporting_evidence"][0]["strength"] == "strong"
+        assert hierarchy["secondary_details"] == []
+    
+    def test_hierarchy_records(self):
+        """Test that hierarchy records are slotted and convert to dicts."""
+        idea = IdeaEntry(text="Idea", type="thesis_statement", position="opening")
+        hierarchy = ContentHierarchy([idea], [], [])
+        
+        assert not hasattr(idea, "__dict__")
+        assert hierarchy.to_dict() == {
+            "primary_ideas": [{"text": "Idea", "type": "thesis_statement", "position": "opening"}],
+            "secondary_details": [],
+            "supporting_evidence": []
+        }
+    
+    def test_extraction_class_selection(self):
+        """Test that unselected extraction classes are left out of prompt and examples."""
+        analyzer = ContentAnalyzer(extraction_classes=["evidence", "main_idea"])
+        prompt = analyzer.get_prompt_description()
+        
+        assert "1. **Main Ideas**" in prompt
+        assert "2. **Evidence**" in prompt
+        assert "Argument Structure" not in prompt
+        assert analyzer.get_examples() is not self.analyzer.get_examples()
+        for example in analyzer.get_examples():
+            assert {e.extraction_class for e in example.extractions} <= {"evidence", "main_idea"}
+        
+        with pytest.raises(ValueError):
+            ContentAnalyzer(extraction_classes=["sentiment"])
+    
+    def test_extraction_classes_from_generator(self):
+        """Test that a one-shot iterable of classes is read only once."""
+        requested = (name for name in EXTRACTION_CLASSES[:3])
+        analyzer = ContentAnalyzer(extraction_classes=requested)
+        
+        assert analyzer._extraction_classes == EXTRACTION_CLASSES[:3]
+        with pytest.raises(ValueError):
+            ContentAnalyzer(extraction_classes="main_idea")
+        with pytest.raises(ValueError):
+            ContentAnalyzer(extraction_classes=(name for name in ["main_idea", "sentiment"]))
+    
+    def test_split_sentences(self):
+        """Test sentence splitting and its cache."""
+        sentences = self.analyzer._split_sentences("One. Two!  Three?! ")
+        
+        assert sentences == ["One", "Two", "Three"]
+        assert self.analyzer._split_sentences("One. Two!  Three?! ") == sentences
+        assert self.analyzer._split_sentences("...") == []
+    
+    def test_validate_and_split(self):
+        """Test that validation returns the sentences it split."""
+        is_valid, sentences = self.analyzer._validate_and_split(self.text)
+        
+        assert is_valid
+        assert len(sentences) == 3
+        assert self.analyzer.validate_text(self.text)
+        assert self.analyzer._validate_and_split("Too short. Really.") == (False, ("Too short", "Really"))
+        assert self.analyzer._validate_and_split("   ") == (False, ())
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_batch_streams(self, mock_analyzer_cls):
+        """Test that batch analysis consumes texts one chunk at a time."""
+        mock_analyzer_cls.return_value = Mock(spec=["analyze"])
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        consumed = []
+        
+        def texts():
+            for i in range(10):
+                consumed.append(i)
+                yield self.text
+        
+        results = self.analyzer.analyze_batch(texts(), batch_size=4)
+        next(results)
+        
+        assert len(consumed) == 4
+        assert len(list(results)) == 9
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_batch_async(self, mock_analyzer_cls):
+        """Test that async batch analysis matches sequential analysis."""
+        mock_analyzer_cls.return_value = Mock(spec=["analyze"])
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        results = asyncio.run(self.analyzer.analyze_batch_async([self.text] * 5, concurrency=2))
+        
+        assert len(results) == 5
+        assert all(result.metadata == self.analyzer.analyze(self.text).metadata for result in results)
+        with pytest.raises(ValueError):
+            asyncio.run(self.analyzer.analyze_async("Too short."))
+    
+    def test_analyze_batch_rejects_short_text(self):
+        """Test that batch analysis validates every text."""
+        with pytest.raises(ValueError):
+            list(self.analyzer.analyze_batch([self.text, "Too short."]))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
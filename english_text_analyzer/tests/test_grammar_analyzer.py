@@ -0,0 +1,182 @@
+"""Tests for GrammarAnalyzer."""
+
+import pytest
+from unittest.mock import Mock, patch
+import langextract as lx
+
+from ..analyzers.grammar import GrammarAnalyzer
+from ._helpers import make_extraction, mock_document
+
+
+class TestGrammarAnalyzer:
+    """Test cases for GrammarAnalyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = GrammarAnalyzer()
+        self.text = "She has lived in Seoul since 2010. If I had known, I would have come."
+    
+    def _mock_document(self, text):
+        """Build a langextract-like document with grammar extractions."""
+        return mock_document(text, [
+            make_extraction("verb_tense", "has lived", tense="present_perfect"),
+            make_extraction("verb_tense", "had known", tense="past_perfect"),
+            make_extraction("verb_tense", "would have come", tense="conditional_perfect"),
+            make_extraction("sentence_type", self.text, type="complex"),
+            make_extraction("clause_structure", "If I had known", clause_type="conditional_clause"),
+            make_extraction("complex_structure", "If I had known, I would have come", structure_type="third_conditional"),
+        ])
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_is_memoized(self, mock_analyzer_cls):
+        """Test that repeated analysis of the same text hits the cache."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        first = self.analyzer.analyze(self.text)
+        second = self.analyzer.analyze(self.text)
+        
+        assert second.to_dict() == first.to_dict()
+        assert mock_analyzer_cls.return_value.analyze.call_count == 1
+        
+        self.analyzer.clear_cache()
+        self.analyzer.analyze(self.text)
+        assert mock_analyzer_cls.return_value.analyze.call_count == 2
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_reuses_analyzer(self, mock_analyzer_cls):
+        """Test that analyses of different texts share one langextract analyzer."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        self.analyzer.analyze(self.text)
+        self.analyzer.analyze("They have finished the project on time.")
+        
+        mock_analyzer_cls.assert_called_once_with(
+            examples=self.analyzer.get_examples(),
+            description=self.analyzer.get_prompt_description()
+        )
+        assert mock_analyzer_cls.return_value.analyze.call_count == 2
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_batch(self, mock_analyzer_cls):
+        """Test that batch analysis matches single-text analysis."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        
+        results = self.analyzer.analyze_batch([self.text] * 3, max_workers=2)
+        
+        assert len(results) == 3
+        assert lx_analyzer.analyze.call_count == 3
+        assert results[0].to_dict() == GrammarAnalyzer().analyze(self.text).to_dict()
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_cached_results_are_copies(self, mock_analyzer_cls):
+        """Test that modifying a returned result does not affect later cache hits."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        first = self.analyzer.analyze(self.text)
+        first.add_metadata("note", 1)
+        first.analysis_data["verb_tense"].clear()
+        second = self.analyzer.analyze(self.text)
+        
+        assert second is not first
+        assert "note" not in second.metadata
+        assert len(second.analysis_data["verb_tense"]) == 3
+        assert mock_analyzer_cls.return_value.analyze.call_count == 1
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_batch_shares_memory_cache(self, mock_analyzer_cls):
+        """Test that batch and single-text analysis reuse each other's results."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        other = "They have finished the project on time."
+        
+        single = self.analyzer.analyze(self.text)
+        batch = self.analyzer.analyze_batch([self.text, other])
+        again = self.analyzer.analyze(other)
+        
+        assert lx_analyzer.analyze.call_count == 2
+        assert batch[0].to_dict() == single.to_dict()
+        assert again.to_dict() == batch[1].to_dict()
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_disk_cache(self, mock_analyzer_cls, tmp_path):
+        """Test that results persist across analyzer instances."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        first = GrammarAnalyzer(cache_dir=tmp_path).analyze(self.text)
+        second = GrammarAnalyzer(cache_dir=tmp_path).analyze(self.text)
+        
+        assert second.to_dict() == first.to_dict()
+        assert mock_analyzer_cls.return_value.analyze.call_count == 1
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+    
+    def test_get_examples(self):
+        """Test example data generation."""
+        examples = self.analyzer.get_examples()
+        
+        assert len(examples) > 0
+        for example in examples:
+            assert isinstance(example, lx.data.ExampleData)
+            assert len(example.extractions) > 0
+    
+    def test_examples_shared_across_instances(self):
+        """Test that examples and prompt are built once per process."""
+        other = GrammarAnalyzer()
+        assert other.get_examples() is self.analyzer.get_examples()
+        assert other.get_prompt_description() is self.analyzer.get_prompt_description()
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_grammar_metadata(self, mock_analyzer_cls):
+        """Test distributions and scores built from extractions."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        result = self.analyzer.analyze(self.text)
+        metadata = result.metadata
+        
+        assert metadata["total_sentences"] == 2
+        assert metadata["average_sentence_length"] == 7.5
+        assert metadata["tense_distribution"] == {
+            "present_perfect": 1, "past_perfect": 1, "conditional_perfect": 1
+        }
+        assert metadata["tense_complexity_score"] == 4
+        assert metadata["sentence_type_distribution"] == {"complex": 1}
+        assert metadata["sentence_complexity_score"] == 3
+        assert metadata["dependency_distribution"] == {"conditional_clause": 1}
+        assert metadata["syntactic_complexity_score"] == 4
+        
+        structure = result.analysis_data["complex_structure"][0]["attributes"]
+        assert structure["difficulty_for_korean_learners"] == "고급"
+        assert "would have" in structure["common_korean_errors"]
+    
+    def test_split_sentences(self):
+        """Test sentence splitting and its cache."""
+        sentences = self.analyzer._split_sentences("One. Two!  Three?! ")
+        
+        assert sentences == ["One", "Two", "Three"]
+        assert self.analyzer._split_sentences("One. Two!  Three?! ") == sentences
+        assert self.analyzer._split_sentences("...") == []
+    
+    def test_validate_text(self):
+        """Test that validation matches the split-based sentence rule."""
+        assert self.analyzer.validate_text(self.text)
+        assert self.analyzer.validate_text("Short one. This has three words")
+        assert self.analyzer.validate_text("tab\tseparated\nwords here")
+        assert not self.analyzer.validate_text("Two words. Only two! Yes, really?")
+        assert not self.analyzer.validate_text("a.b.c.d.e.f.g.h.i")
+        assert not self.analyzer.validate_text("   ")
+    
+    def test_configuration_schema_is_copied(self):
+        """Test that callers cannot modify the cached schema."""
+        schema = self.analyzer.get_configuration_schema()
+        schema["enabled"]["default"] = False
+        del schema["complexity_threshold"]
+        
+        fresh = GrammarAnalyzer().get_configuration_schema()
+        assert fresh["enabled"]["default"] is True
+        assert fresh["complexity_threshold"]["default"] == 2.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -3,6 +3,7 @@
 import pytest
 from datetime import datetime
 import json
+from unittest.mock import patch
 
 from ..models.results import (
     AnalysisResults, VocabularyResult, GrammarResult, 
@@ -192,6 +193,58 @@ class TestAnalysisResults:
         assert parsed["text"] == self.sample_text
         assert parsed["title"] == "Test Analysis"
     
+    def test_to_json_matches_json_module(self):
+        """Test that the orjson fast path (if installed) matches json output."""
+        self.results.calculate_text_statistics()
+        content_result = AnalysisResult("content", {
+            "main_idea": [{"text": "Idea", "attributes": {"educational_note": "주제문"}}]
+        })
+        content_result.add_metadata("main_idea_density", 0.333)
+        content_result.add_metadata("content_hierarchy", {"primary_ideas": [], "secondary_details": []})
+        self.results.add_analyzer_result(content_result)
+        
+        with patch("english_text_analyzer.models.results.orjson", None):
+            expected = self.results.to_json()
+        
+        assert self.results.to_json() == expected
+    
+    def test_to_json_non_finite_floats(self):
+        """Test the documented orjson difference for NaN and infinities."""
+        from ..models import results as results_module
+        
+        self.results.add_analyzer_result(AnalysisResult("complexity", {
+            "nan": float("nan"), "inf": float("inf"), "ratio": 0.5
+        }))
+        
+        with patch.object(results_module, "orjson", None):
+            json_data = json.loads(self.results.to_json())
+        fast_data = json.loads(self.results.to_json())
+        
+        json_values = json_data["analyzer_results"]["complexity"]["analysis_data"]
+        fast_values = fast_data["analyzer_results"]["complexity"]["analysis_data"]
+        assert json_values["nan"] != json_values["nan"]
+        assert json_values["inf"] == float("inf")
+        assert fast_values["ratio"] == json_values["ratio"]
+        if results_module.orjson is not None:
+            assert fast_values["nan"] is None
+            assert fast_values["inf"] is None
+        else:
+            assert fast_values["inf"] == float("inf")
+    
+    def test_to_json_rejects_datetime_on_both_paths(self):
+        """Test that values json rejects are not silently encoded by orjson."""
+        from ..models import results as results_module
+        
+        self.results.add_analyzer_result(AnalysisResult("content", {
+            "created": datetime(2024, 1, 1)
+        }))
+        
+        with patch.object(results_module, "orjson", None):
+            with pytest.raises(TypeError):
+                self.results.to_json()
+        with pytest.raises(TypeError):
+            self.results.to_json()
+    
     def test_from_dict(self):
         """Test creating AnalysisResults from dictionary."""
         self.results.calculate_text_statistics()
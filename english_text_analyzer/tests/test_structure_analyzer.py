@@ -0,0 +1,199 @@
+"""Tests for StructureAnalyzer."""
+
+import re
+import pytest
+from unittest.mock import Mock, patch
+import langextract as lx
+
+from ..analyzers import structure
+from ..analyzers.structure import StructureAnalyzer
+from ._helpers import make_extraction, mock_document
+
+
+class TestStructureAnalyzer:
+    """Test cases for StructureAnalyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = StructureAnalyzer()
+        self.text = (
+            "Climate change is a pressing issue. First, temperatures are rising.\n\n"
+            "However, many people still ignore it. Therefore, we must act now."
+        )
+    
+    def _mock_document(self, text):
+        """Build a langextract-like document with structure extractions."""
+        return mock_document(text, [
+            make_extraction("topic_sentence", "Climate change is a pressing issue.", position="opening"),
+            make_extraction("transition_marker", "First", type="sequence"),
+            make_extraction("transition_marker", "However", type="contrast"),
+            make_extraction("transition_marker", "Therefore", type="conclusion"),
+            make_extraction("cohesion_device", "it", type="reference"),
+            make_extraction("paragraph_structure", "Climate change is a pressing issue.", pattern="general_to_specific"),
+            make_extraction("paragraph_structure", "However, many people still ignore it.", pattern="problem_solution"),
+        ])
+    
+    def test_get_examples(self):
+        """Test example data generation."""
+        examples = self.analyzer.get_examples()
+        
+        assert len(examples) > 0
+        for example in examples:
+            assert isinstance(example, lx.data.ExampleData)
+            assert len(example.extractions) > 0
+    
+    def test_examples_shared_across_instances(self):
+        """Test that examples and prompt are built once per process."""
+        other = StructureAnalyzer()
+        assert other.get_examples() is self.analyzer.get_examples()
+        assert other.get_prompt_description() is self.analyzer.get_prompt_description()
+    
+    def test_extraction_class_selection(self):
+        """Test that unselected extraction classes are left out of prompt and examples."""
+        analyzer = StructureAnalyzer(extraction_classes=["cohesion_device", "transition_marker"])
+        prompt = analyzer.get_prompt_description()
+        
+        assert "1. **Transition Markers**" in prompt
+        assert "2. **Cohesion Devices**" in prompt
+        assert "Topic Sentences" not in prompt
+        assert analyzer.get_examples() is not self.analyzer.get_examples()
+        for example in analyzer.get_examples():
+            assert {e.extraction_class for e in example.extractions} <= {"cohesion_device", "transition_marker"}
+        
+        with pytest.raises(ValueError):
+            StructureAnalyzer(extraction_classes=["sentiment"])
+    
+    def test_extraction_classes_from_generator(self):
+        """Test that a one-shot iterable of classes is read only once."""
+        requested = (name for name in structure.EXTRACTION_CLASSES[:3])
+        analyzer = StructureAnalyzer(extraction_classes=requested)
+        
+        assert analyzer._extraction_classes == structure.EXTRACTION_CLASSES[:3]
+        with pytest.raises(ValueError):
+            StructureAnalyzer(extraction_classes="topic_sentence")
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_structure_metadata(self, mock_analyzer_cls):
+        """Test distributions and ratios built from extractions."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        result = self.analyzer.analyze(self.text)
+        metadata = result.metadata
+        
+        assert metadata["total_paragraphs"] == 2
+        assert metadata["total_sentences"] == 4
+        assert metadata["average_sentences_per_paragraph"] == 2.0
+        assert metadata["transition_type_distribution"] == {"sequence": 1, "contrast": 1, "conclusion": 1}
+        assert metadata["transition_density"] == 0.75
+        assert metadata["transition_variety_score"] == 3
+        assert metadata["cohesion_device_distribution"] == {"reference": 1}
+        assert metadata["coherence_ratio"] == 0.25
+        assert metadata["paragraph_pattern_distribution"] == {"general_to_specific": 1, "problem_solution": 1}
+        assert metadata["average_paragraph_length"] == 10.5
+        assert metadata["paragraph_length_variation"] == 0.7
+    
+    def test_split_sentences(self):
+        """Test that the ASCII fast path and the regex split agree."""
+        assert self.analyzer._split_sentences("One. Two!  Three?! ...Four") == ["One", "Two", "Three", "Four"]
+        assert self.analyzer._split_sentences("Café. Über!  Naïve?! ...") == ["Café", "Über", "Naïve"]
+    
+    def test_split_paragraphs(self):
+        """Test that blank lines with whitespace or CRLF separate paragraphs."""
+        text = "One.\n\nTwo.\r\n\r\nThree.\n \t\nFour.\n\n\n\nFive.\nStill five."
+        
+        assert self.analyzer._split_paragraphs(text) == [
+            "One.", "Two.", "Three.", "Four.", "Five.\nStill five."
+        ]
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_batch(self, mock_analyzer_cls):
+        """Test that batch analysis sets up langextract once and matches analyze()."""
+        lx_analyzer = Mock(spec=["analyze"])
+        lx_analyzer.analyze.side_effect = self._mock_document
+        mock_analyzer_cls.return_value = lx_analyzer
+        
+        results = self.analyzer.analyze_batch([self.text] * 3, max_workers=2)
+        single = self.analyzer.analyze(self.text)
+        
+        assert len(results) == 3
+        assert results[0].to_dict() == single.to_dict()
+        mock_analyzer_cls.assert_called_once()
+        assert lx_analyzer.analyze.call_count == 4
+    
+    def test_configuration_schema_is_copied(self):
+        """Test that callers cannot modify the cached schema."""
+        schema = self.analyzer.get_configuration_schema()
+        schema["coherence_threshold"]["default"] = 0.9
+        schema["extraction_classes"]["default"].clear()
+        
+        fresh = StructureAnalyzer().get_configuration_schema()
+        assert fresh["coherence_threshold"]["default"] == 0.3
+        assert fresh["extraction_classes"]["default"] == list(structure.EXTRACTION_CLASSES)
+    
+    def test_rejects_single_sentence(self):
+        """Test that structure analysis needs at least two sentences."""
+        assert not self.analyzer.validate_text("Only one sentence here")
+        with pytest.raises(ValueError):
+            self.analyzer.analyze("Only one sentence here")
+    
+    def test_validate_and_split(self):
+        """Test that validation returns the sentences it split."""
+        is_valid, sentences = self.analyzer._validate_and_split(self.text)
+        
+        assert is_valid
+        assert sentences == self.analyzer._split_sentences(self.text)
+        assert self.analyzer._validate_and_split("   ") == (False, [])
+    
+    def test_find_transition_markers(self):
+        """Test that only sentence-initial markers followed by a comma are found."""
+        text = (
+            "However, it rained. We stayed first in line. As a result, we got wet!\n"
+            "On the   other hand, it was fun. Thus we left. Finally,"
+        )
+        markers = structure._find_transition_markers(text)
+        
+        assert [marker["text"] for marker in markers] == [
+            "However", "As a result", "On the   other hand", "Finally"
+        ]
+        assert markers[2]["attributes"]["type"] == "contrast"
+        assert markers[2]["attributes"]["function"] == "alternative_viewpoint"
+        assert text[markers[1]["start_index"]:markers[1]["end_index"]] == "As a result"
+    
+    def test_transition_scan_matches_re_fallback(self):
+        """Test that the Hyperscan scan, the re fallback and per-phrase regexes agree."""
+        text = self.text + " In addition, thus, hence. Nevertheless, firstly, first, in conclusion,"
+        expected = sorted(
+            match.span()
+            for pattern in structure._TRANSITION_PATTERNS
+            for match in re.finditer(pattern, text, re.IGNORECASE)
+        )
+        
+        assert structure._transition_spans(text) == expected
+        with patch.object(structure, "_TRANSITION_DATABASE", None):
+            assert structure._transition_spans(text) == expected
+    
+    def test_trie_pattern(self):
+        """Test that the trie-factored pattern matches exactly the phrases."""
+        pattern = re.compile(structure._trie_pattern(["in addition", "in contrast", "first", "firstly"]))
+        
+        assert pattern.pattern == r"\b(?:first(?:ly)?|in\s+(?:addition|contrast))\b"
+        assert [m.group() for m in pattern.finditer("first firstly firsts in  contrast in")] == [
+            "first", "firstly", "in  contrast"
+        ]
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_lexicon_transitions(self, mock_analyzer_cls):
+        """Test that lexicon hits only add markers the model did not report."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        text = self.text + " Moreover, it is costly."
+        result = StructureAnalyzer(lexicon_transitions=True).analyze(text)
+        markers = result.analysis_data["transition_marker"]
+        
+        # "First", "However" and "Therefore" are already reported by the model
+        assert [marker["text"] for marker in markers] == ["First", "However", "Therefore", "Moreover"]
+        assert markers[-1]["attributes"]["source"] == "lexicon"
+        assert markers[-1]["start_index"] == text.index("Moreover")
+        assert result.metadata["transition_type_distribution"] == {
+            "sequence": 1, "contrast": 1, "conclusion": 1, "addition": 1
+        }
@@ -0,0 +1,128 @@
+"""Tests for VocabularyAnalyzer."""
+
+import pytest
+from unittest.mock import patch
+import langextract as lx
+
+from ..analyzers.vocabulary import VocabularyAnalyzer
+from ..core.base_analyzer import AnalysisResult
+from ._helpers import make_extraction, mock_document
+
+
+class TestVocabularyAnalyzer:
+    """Test cases for VocabularyAnalyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = VocabularyAnalyzer()
+        self.text = "Students should take advantage of the library. The Library is open and the staff can help."
+    
+    def _mock_document(self, text):
+        """Build a langextract-like document with vocabulary extractions."""
+        return mock_document(text, [
+            make_extraction("collocation", "take advantage of", collocation_type="verb_phrase"),
+            make_extraction("basic_vocabulary", "library", cefr_level="A2"),
+            make_extraction("idiomatic_expression", "take advantage of", meaning="use well"),
+        ])
+    
+    def test_get_examples(self):
+        """Test example data generation."""
+        examples = self.analyzer.get_examples()
+        
+        assert len(examples) > 0
+        for example in examples:
+            assert isinstance(example, lx.data.ExampleData)
+            assert len(example.extractions) > 0
+    
+    def test_examples_shared_across_instances(self):
+        """Test that examples and prompt are built once per process."""
+        other = VocabularyAnalyzer()
+        assert other.get_examples() is self.analyzer.get_examples()
+        assert other.get_prompt_description() is self.analyzer.get_prompt_description()
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_is_memoized(self, mock_analyzer_cls):
+        """Test that repeated analysis of the same text hits the cache."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        first = self.analyzer.analyze(self.text)
+        second = self.analyzer.analyze(self.text)
+        
+        assert second.to_dict() == first.to_dict()
+        assert mock_analyzer_cls.return_value.analyze.call_count == 1
+        
+        self.analyzer.clear_cache()
+        self.analyzer.analyze(self.text)
+        assert mock_analyzer_cls.return_value.analyze.call_count == 2
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_cached_results_are_copies(self, mock_analyzer_cls):
+        """Test that modifying a returned result does not affect later cache hits."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        first = self.analyzer.analyze(self.text)
+        first.add_metadata("note", 1)
+        first.analysis_data["collocation"][0]["attributes"]["strength"] = "high"
+        second = self.analyzer.analyze(self.text)
+        
+        assert second is not first
+        assert "note" not in second.metadata
+        assert second.analysis_data["collocation"][0]["attributes"]["strength"] == "medium"
+        assert mock_analyzer_cls.return_value.analyze.call_count == 1
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_analyze_reuses_analyzer(self, mock_analyzer_cls):
+        """Test that analyses of different texts share one langextract analyzer."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        self.analyzer.analyze(self.text)
+        self.analyzer.analyze("The committee will take advantage of the new data.")
+        
+        mock_analyzer_cls.assert_called_once_with(
+            examples=self.analyzer.get_examples(),
+            description=self.analyzer.get_prompt_description()
+        )
+        assert mock_analyzer_cls.return_value.analyze.call_count == 2
+    
+    @patch("langextract.Analyzer", create=True)
+    def test_vocabulary_metadata(self, mock_analyzer_cls):
+        """Test word statistics and enhancement attributes."""
+        mock_analyzer_cls.return_value.analyze.side_effect = self._mock_document
+        
+        result = self.analyzer.analyze(self.text)
+        
+        assert result.metadata["total_words"] == 16
+        assert result.metadata["unique_words"] == 14
+        assert result.metadata["lexical_diversity"] == 0.875
+        
+        collocation = result.analysis_data["collocation"][0]["attributes"]
+        assert collocation["strength"] == "medium"
+        assert collocation["usage_examples"][0] == "Take advantage of this opportunity"
+        
+        idiom = result.analysis_data["idiomatic_expression"][0]["attributes"]
+        assert idiom["figurative_meaning"] is True
+    
+    def test_rejects_short_text(self):
+        """Test that vocabulary analysis needs at least five words."""
+        assert not self.analyzer.validate_text("Too few words here")
+        with pytest.raises(ValueError):
+            self.analyzer.analyze("Too few words here")
+    
+    def test_collocation_usage_examples_priority(self):
+        """Test that the earliest curated phrase wins when several match."""
+        result = AnalysisResult("vocabulary", {
+            "collocation": [
+                {"text": "a mixed-methods approach to take advantage of", "attributes": {}},
+                {"text": "a mixed-methods approach", "attributes": {}},
+                {"text": "make a decision", "attributes": {}},
+            ]
+        })
+        
+        self.analyzer._enhance_extractions(result)
+        
+        first, second, third = result.analysis_data["collocation"]
+        assert first["attributes"]["usage_examples"][0] == "Take advantage of this opportunity"
+        assert second["attributes"]["usage_examples"][0] == "The study used a mixed-methods approach"
+        assert "usage_examples" not in third["attributes"]
+        assert third["attributes"]["strength"] == "medium"
+        assert result.analysis_data["idiomatic_expression"] == []
@@ -19,6 +19,19 @@ def get_long_description():
             return f.read()
     return "Comprehensive English text analysis tool for educational purposes."
 
+# Pure-Python modules that can be compiled with Cython for faster post-processing
+CYTHON_MODULES = [
+    "english_text_analyzer/analyzers/content.py",
+    "english_text_analyzer/analyzers/grammar.py",
+]
+
+# Compile CYTHON_MODULES when ETA_CYTHONIZE=1 (requires Cython at build time)
+def get_ext_modules():
+    if os.environ.get("ETA_CYTHONIZE") != "1":
+        return []
+    from Cython.Build import cythonize
+    return cythonize(CYTHON_MODULES, language_level=3)
+
 setup(
     name="english-text-analyzer",
     version=get_version(),
@@ -29,6 +42,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/your-org/english-text-analyzer",
     packages=find_packages(),
+    ext_modules=get_ext_modules(),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Education",
@@ -63,6 +77,10 @@ setup(
             "flask>=2.0.0",
             "jinja2>=3.0.0",
         ],
+        "fast": [
+            "hyperscan>=0.4.0",
+            "orjson>=3.6.0",
+        ],
         "all": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",